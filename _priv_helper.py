@@ -0,0 +1,118 @@
+"""Privileged file-operation helper for the SDR driver fixes.
+
+Reads a JSON list of operations on stdin and applies them in order with
+direct syscalls (`os.replace`, `os.fsync`, `os.chmod`), stopping at the
+first failure. The GUI runs it once per driver fix / undo, via
+`pkexec python3 _priv_helper.py` when elevation is needed, so the whole
+sequence needs a single authorization instead of one `cp`/`mv`/`rm`
+process per step.
+
+Supported operations (paths must live in one of `ALLOWED_DIRS`):
+
+    {"op": "write", "path": "/etc/...", "content": "...", "mode": 420, "backup": true}
+    {"op": "restore", "path": "/etc/...", "backup": "/etc/....bak"}
+    {"op": "remove", "path": "/etc/..."}
+
+A JSON list with one result per attempted operation is printed on
+stdout. Exit status is 0 if every operation succeeded, 1 otherwise; the
+failing error is also written to stderr so callers can spot permission
+problems.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# Only the locations touched by the driver fix may be modified
+ALLOWED_DIRS = ('/etc/udev/rules.d', '/etc/modprobe.d')
+
+
+def _check_path(path):
+    if not isinstance(path, str) or os.path.dirname(os.path.abspath(path)) not in ALLOWED_DIRS:
+        raise ValueError(f'path not allowed: {path!r}')
+    return path
+
+
+def _write(path, content, mode=0o644, backup=False):
+    """Atomically replace `path` with `content`, optionally keeping a `.bak` copy."""
+    result = {}
+    if backup and os.path.exists(path):
+        bak = path + '.bak'
+        shutil.copy2(path, bak)
+        result['backup'] = bak
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.' + os.path.basename(path) + '.')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return result
+
+
+def _restore(path, backup):
+    """Move `backup` back over `path`."""
+    if _check_path(backup) != path + '.bak':
+        raise ValueError(f'unexpected backup path: {backup!r}')
+    os.replace(backup, path)
+    return {}
+
+
+def _remove(path):
+    """Remove `path` if it exists."""
+    try:
+        os.unlink(path)
+        return {'removed': True}
+    except FileNotFoundError:
+        return {'removed': False}
+
+
+def apply_op(op):
+    """Apply a single operation dict and return extra result fields."""
+    kind = op.get('op')
+    path = _check_path(op.get('path'))
+    if kind == 'write':
+        return _write(path, op.get('content', ''), int(op.get('mode', 0o644)), bool(op.get('backup')))
+    if kind == 'restore':
+        return _restore(path, op.get('backup'))
+    if kind == 'remove':
+        return _remove(path)
+    raise ValueError(f'unknown op: {kind!r}')
+
+
+def main():
+    try:
+        ops = json.load(sys.stdin)
+        if not isinstance(ops, list) or not all(isinstance(op, dict) for op in ops):
+            raise ValueError('expected a JSON list of operation objects')
+    except ValueError as e:
+        print(f'invalid input: {e}', file=sys.stderr)
+        return 2
+
+    results = []
+    for op in ops:
+        entry = {'op': op.get('op'), 'path': op.get('path')}
+        try:
+            entry.update(apply_op(op))
+            entry['ok'] = True
+            results.append(entry)
+        except Exception as e:
+            entry.update({'ok': False, 'error': str(e)})
+            results.append(entry)
+            print(json.dumps(results))
+            print(f"{entry['op']} {entry['path']}: {e}", file=sys.stderr)
+            return 1
+    print(json.dumps(results))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
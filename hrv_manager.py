@@ -1,12 +1,30 @@
 import asyncio
+import logging
 import subprocess
 from datetime import datetime
-from queue import Queue
+from queue import Queue, Empty, Full
 import threading
 from bleak import BleakClient, BleakScanner
 from typing import Dict, List, Optional
 import numpy as np
 
+# Child of the app logger, so messages share its (queued) handlers
+logger = logging.getLogger('mindfield.hrv')
+
+def put_dropping_oldest(q: Queue, item):
+    """Put `item` on a bounded queue without blocking; when it is full the
+    oldest entry is discarded to make room, so the freshest samples win."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except Full:
+            try:
+                q.get_nowait()
+            except Empty:
+                pass
+
+
 class HRVDeviceManager:
     def __init__(self, coherence_queue: Queue):
         self.coherence_queue = coherence_queue
@@ -15,6 +33,8 @@ class HRVDeviceManager:
         self.monitor_tasks = {}
         self.running = False
         self.latest_coherence = []
+        # address -> participant name; filled in by GroupSessionManager
+        self.device_names = {}
         self._async_loop = None
         self._thread = None
         
@@ -37,6 +57,11 @@ class HRVDeviceManager:
         if not self._thread or not self._thread.is_alive():
             self._thread = threading.Thread(target=self._run_async_loop, daemon=True)
             self._thread.start()
+        elif self._async_loop is not None and self._async_loop.is_running():
+            # Loop already up: hand the new monitors to it rather than waiting
+            # for a restart (`_async_main` only starts the devices known at launch)
+            for addr in addresses:
+                asyncio.run_coroutine_threadsafe(self._start_monitor(addr), self._async_loop)
             
     def _run_async_loop(self):
         """Run the async event loop in a separate thread"""
@@ -50,13 +75,17 @@ class HRVDeviceManager:
         
         # Start monitors for all active devices
         for addr in list(self.active_devices.keys()):
-            task = asyncio.create_task(self._monitor_device(addr))
-            self.monitor_tasks[addr] = task
+            await self._start_monitor(addr)
             
         # Keep running until stopped
         while self.running:
             await asyncio.sleep(1)
             
+    async def _start_monitor(self, address):
+        """Start a monitor task for `address` unless one is already running (loop thread)."""
+        if address not in self.monitor_tasks:
+            self.monitor_tasks[address] = asyncio.create_task(self._monitor_device(address))
+
     async def _monitor_device(self, address):
         """Monitor a specific device with resilient connection"""
         device_name = self.active_devices.get(address, "Unknown")
@@ -67,7 +96,7 @@ class HRVDeviceManager:
             try:
                 # Force clean state for 808S
                 if is_808s and attempt > 0:
-                    print(f"Resetting BLE for {address}...")
+                    logger.info('Resetting BLE for %s...', address)
                     subprocess.run(["sudo", "hciconfig", "hci0", "reset"], capture_output=True)
                     await asyncio.sleep(2)
                     
@@ -76,18 +105,18 @@ class HRVDeviceManager:
                 
                 # Verify services available
                 if not client.services:
-                    print(f"No services found for {address}")
+                    logger.warning('No services found for %s', address)
                     await client.disconnect()
                     continue
                     
-                print(f"Connected to {address} (attempt {attempt + 1})")
+                logger.info('Connected to %s (attempt %d)', address, attempt + 1)
                 self.active_devices[address] = "Connected"
                 
                 # Set up notification handler
                 def handler(sender, data):
                     hr_data = self._parse_hr_data(data, address)
                     if hr_data:
-                        self.coherence_queue.put(hr_data)
+                        put_dropping_oldest(self.coherence_queue, hr_data)
                         self.latest_coherence.append(hr_data)
                         if len(self.latest_coherence) > 100:
                             self.latest_coherence.pop(0)
@@ -102,9 +131,9 @@ class HRVDeviceManager:
                 await client.disconnect()
                 
             except Exception as e:
-                print(f"Device {address} error: {e}")
+                logger.warning('Device %s error: %s', address, e)
                 if attempt == max_retries - 1:
-                    self.coherence_queue.put({
+                    put_dropping_oldest(self.coherence_queue, {
                         'timestamp': datetime.now().timestamp(),
                         'device': address,
                         'error': str(e),
@@ -157,7 +186,7 @@ class HRVDeviceManager:
             }
             
         except Exception as e:
-            print(f"Parse error for {address}: {e}")
+            logger.warning('Parse error for %s: %s', address, e)
             return None
             
     def get_all_coherence(self) -> List[Dict]:
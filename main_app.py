@@ -2,24 +2,62 @@ import tkinter as tk
 from tkinter import messagebox, filedialog, ttk, simpledialog
 import tkinter.scrolledtext as scrolledtext
 import threading
+import concurrent.futures
 from collections import deque
 import os
+import mmap
 import asyncio
 import logging
+import logging.handlers
+import atexit
+import contextlib
 from datetime import datetime
 import time
+import re
 import subprocess
+import sys
+import shutil
 try:
     import dbus
 except Exception:
     dbus = None
+# Async DBus client for BlueZ (dbus-fast ships with bleak on Linux; dbus-next is
+# API compatible). Preferred over dbus-python when available.
+try:
+    from dbus_fast.aio import MessageBus as AioMessageBus
+    from dbus_fast import BusType as AioBusType
+except Exception:
+    try:
+        from dbus_next.aio import MessageBus as AioMessageBus
+        from dbus_next import BusType as AioBusType
+    except Exception:
+        AioMessageBus = None
+        AioBusType = None
+import base64
+import struct
+import zlib
+import functools
+import itertools
 import csv
 import json
-from hrv_manager import HRVDeviceManager
+import numpy as np
+# Optional fast JSON encoder (C implementation); stdlib json is the fallback
+try:
+    import orjson
+except Exception:
+    orjson = None
+from hrv_manager import HRVDeviceManager, put_dropping_oldest
 from rng_collector import RNGCollector
 from aqrng import get_random_bytes
+# SDR entropy source (optional); sdr_rng already degrades without pyrtlsdr, this
+# only guards against the module itself failing to import
+try:
+    from sdr_rng import SDRRNG, is_sdr_available
+except Exception:
+    SDRRNG = None
+    is_sdr_available = None
 from group_session import GroupSessionManager
-from queue import Queue, Empty
+from queue import Queue, Empty, Full
 import getpass
 import pathlib
 import tkinter.font as tkfont
@@ -40,21 +78,444 @@ except Exception:
     FigureCanvasTkAgg = None
     _MPL_AVAILABLE = False
 
+# Directory containing this module, resolved once at import
+_MODULE_DIR = pathlib.Path(__file__).resolve().parent
+_AUDIT_LOG_PATH = _MODULE_DIR / 'audit.log'
+_PRIV_HELPER_PATH = _MODULE_DIR / '_priv_helper.py'
+# Written once onboarding has been shown (or dismissed with "Don't show again")
+_SEEN_FLAG_PATH = _MODULE_DIR / '.mindfield_seen'
+
 # Module-level logger
 logger = logging.getLogger('mindfield')
 if not logger.handlers:
-    logger.setLevel(logging.DEBUG)
+    # INFO by default so debug calls on worker threads are cheap no-ops;
+    # set MINDFIELD_LOG_LEVEL=DEBUG for troubleshooting
+    _log_level = getattr(logging, os.environ.get('MINDFIELD_LOG_LEVEL', 'INFO').upper(), logging.INFO)
+    logger.setLevel(_log_level)
     try:
-        root = pathlib.Path(__file__).resolve().parent
-        logpath = root / 'mindfield.log'
+        logpath = _MODULE_DIR / 'mindfield.log'
         fh = logging.FileHandler(logpath, encoding='utf-8')
-        fh.setLevel(logging.DEBUG)
+        fh.setLevel(_log_level)
         fmt = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
         fh.setFormatter(fmt)
-        logger.addHandler(fh)
+        # Callers (Tk and worker threads) only enqueue records; a listener
+        # thread does the file writes
+        _log_queue = Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        _log_listener = logging.handlers.QueueListener(_log_queue, fh, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
     except Exception:
         # fallback to basic config
-        logging.basicConfig(level=logging.DEBUG)
+        logging.basicConfig(level=_log_level)
+
+# Heuristic markers for permission failures in command output
+_PERM_RE = re.compile(r'permission|denied|not authorized|authorization', re.IGNORECASE)
+
+
+def _looks_perm(text) -> bool:
+    """Return True if `text` looks like a permission/authorization error."""
+    return bool(text) and _PERM_RE.search(text) is not None
+
+
+# bluetoothctl with its own command timeout; its interactive client can
+# otherwise hang well past the Python-side timeout
+_BTCTL = ["bluetoothctl", "--timeout", "3"]
+
+
+@functools.lru_cache(maxsize=32)
+def _which(name):
+    """Cached `shutil.which`; probe tools don't move while the app runs."""
+    return shutil.which(name)
+
+
+def _spawn_probe(cmd, text=False):
+    """Start a short read-only status command (rfkill, bluetoothctl) with piped output.
+
+    The executable is resolved to an absolute path and fds are left to their
+    own inheritable flags (Python's are close-on-exec already), which lets
+    `subprocess` start it with posix_spawn instead of fork+exec. Raises
+    FileNotFoundError if the tool is not installed.
+    """
+    exe = _which(cmd[0])
+    if exe is None:
+        raise FileNotFoundError(cmd[0])
+    return subprocess.Popen([exe, *cmd[1:]], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=text, close_fds=False)
+
+
+def _run_killable(cmd, timeout, text=True):
+    """Like `subprocess.run(cmd, capture_output=True, text=text, timeout=...)`,
+    but SIGKILLs the child on timeout and waits at most a second to reap it
+    before re-raising `subprocess.TimeoutExpired`. Started via `_spawn_probe`.
+    """
+    proc = _spawn_probe(cmd, text=text)
+    try:
+        out, err = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        try:
+            proc.wait(1)
+        except Exception:
+            pass
+        raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout=out, stderr=err)
+
+
+# "Soft/Hard blocked: yes|no" in rfkill output, "Powered: yes|no" in bluetoothctl
+# output; matched case-insensitively on the raw bytes, without lowercasing copies
+_RFKILL_RE = re.compile(rb'blocked:[ \t]*(yes|no)', re.IGNORECASE)
+_BT_POWERED_RE = re.compile(rb'powered:[ \t]*(yes|no)', re.IGNORECASE)
+
+
+def _scan_yes_no(regex, streams):
+    """True if `regex` matched 'yes' anywhere in `streams`, False if it only
+    matched 'no', None if it never matched."""
+    seen = None
+    for s in streams:
+        if not s:
+            continue
+        for m in regex.finditer(s):
+            if m.group(1).lower() == b'yes':
+                return True
+            seen = False
+    return seen
+
+
+def _parse_rfkill(*streams):
+    """Return 'blocked'/'unblocked'/None from raw `rfkill list bluetooth` output streams."""
+    blocked = _scan_yes_no(_RFKILL_RE, streams)
+    if blocked is None:
+        return None
+    return 'blocked' if blocked else 'unblocked'
+
+
+def _parse_bt_powered(*streams):
+    """Return True/False/None for 'Powered:' in raw `bluetoothctl show` output streams."""
+    return _scan_yes_no(_BT_POWERED_RE, streams)
+
+
+# Seconds after a successful seed during which the Seed button is a no-op
+_RESEED_MIN_INTERVAL = 10.0
+
+
+def _wipe(buf: bytearray):
+    """Overwrite `buf` with zeros in place (for seed material once it has been used)."""
+    buf[:] = bytes(len(buf))
+
+
+def _mark_onboarding_seen():
+    """Create `_SEEN_FLAG_PATH` atomically (temp file + rename), so a crash
+    mid-write never leaves a partial flag behind. Raises OSError on failure."""
+    tmp = _SEEN_FLAG_PATH.with_name(_SEEN_FLAG_PATH.name + '.tmp')
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b'seen')
+    finally:
+        os.close(fd)
+    os.replace(tmp, _SEEN_FLAG_PATH)
+
+
+_SYSFS_RFKILL = pathlib.Path('/sys/class/rfkill')
+
+
+def _sysfs_bt_rfkill():
+    """Paths of the Bluetooth rfkill switches under /sys/class/rfkill (may be empty)."""
+    found = []
+    try:
+        for dev in _SYSFS_RFKILL.iterdir():
+            try:
+                if (dev / 'type').read_text().strip() == 'bluetooth':
+                    found.append(dev)
+            except OSError:
+                continue
+    except OSError:
+        pass
+    return found
+
+
+def _sysfs_rfkill_state():
+    """'blocked'/'unblocked' from the kernel's rfkill switches without running
+    `rfkill`; None if there are no Bluetooth switches or they can't be read.
+    Blocked if any switch is soft- or hard-blocked."""
+    devs = _sysfs_bt_rfkill()
+    if not devs:
+        return None
+    try:
+        for dev in devs:
+            if (dev / 'soft').read_text().strip() == '1' or (dev / 'hard').read_text().strip() == '1':
+                return 'blocked'
+    except OSError:
+        return None
+    return 'unblocked'
+
+
+def _sysfs_rfkill_set(block: bool) -> bool:
+    """Soft-block or unblock every Bluetooth rfkill switch by writing sysfs.
+
+    Returns False (touching nothing further) when there are no switches or the
+    files aren't writable, which is the usual case without root.
+    """
+    devs = _sysfs_bt_rfkill()
+    if not devs:
+        return False
+    try:
+        for dev in devs:
+            (dev / 'soft').write_text('1' if block else '0')
+    except OSError:
+        return False
+    return True
+
+
+# Capacity of the HRV sample queue; well above what `_hrv_consumer` normally
+# has pending (HR notifications arrive about once per second per device)
+_COHERENCE_QUEUE_MAX = 1024
+
+# Device name used by the synthetic HRV graph test
+_HRV_TEST_DEVICE = 'graph-test'
+
+# Column layout shared by the HRV CSV export and the session report
+_HRV_CSV_HEADER = ['timestamp', 'device', 'heart_rate', 'coherence', 'bit_index', 'rr_intervals']
+
+
+def _csv_field(v) -> str:
+    """Format one value the way `csv.writer` (QUOTE_MINIMAL) would."""
+    if v is None:
+        return ''
+    t = type(v)
+    if t is int or t is float:
+        return repr(v)
+    v = v if t is str else str(v)
+    if ',' in v or '"' in v or '\n' in v or '\r' in v:
+        return '"' + v.replace('"', '""') + '"'
+    return v
+
+
+def _hrv_csv_lines(snapshots):
+    """Return ready-to-write CSV lines for HRV snapshot dicts; rr_intervals as
+    compact JSON (the 'rr_intervals_json' cached by RNGCollector when present).
+
+    Output matches `csv.writer` with the default dialect, but the mostly
+    numeric rows are joined directly instead of going through the writer per row.
+    `snapshots` may be the live collector deque: it is iterated in place, and
+    only copied if the HRV consumer appends to it mid-export.
+    """
+    dumps = json.dumps
+
+    def _format(items):
+        lines = []
+        for s in items:
+            rr = s.get('rr_intervals_json')
+            if rr is None:
+                rr = dumps(s.get('rr_intervals'), separators=(',', ':'))
+            lines.append(','.join((_csv_field(s.get('timestamp')), _csv_field(s.get('device')),
+                                   _csv_field(s.get('heart_rate')), _csv_field(s.get('coherence')),
+                                   _csv_field(s.get('bit_index')), _csv_field(rr))) + '\r\n')
+        return lines
+
+    try:
+        return _format(snapshots)
+    except RuntimeError:
+        # deque mutated during iteration; list() of a deque is atomic under the GIL
+        return _format(list(snapshots))
+
+
+# Hex byte string as accepted by bytes.fromhex (pairs of hex digits, optional spaces)
+_HEX_TOKEN_RE = re.compile(r'(?:\s*[0-9A-Fa-f]{2})+\s*')
+
+
+def _unpack_bits_le(data) -> list:
+    """Unpack bytes to a list of 0/1 ints, least-significant bit of each byte first."""
+    return np.unpackbits(np.frombuffer(bytes(data), dtype=np.uint8), bitorder='little').tolist()
+
+
+class SDRNotReadyError(RuntimeError):
+    """The SDR device is still being initialized; skip this read."""
+
+
+class _RingBuf:
+    """Fixed-capacity float32 ring buffer (oldest value dropped when full).
+
+    Every value is stored twice, at `i` and `i + n`, so the contents are
+    always one contiguous slice and `view()` never has to copy.
+    """
+
+    def __init__(self, n: int):
+        self.n = max(1, int(n))
+        self.buf = np.zeros(2 * self.n, dtype=np.float32)
+        self.head = 0
+        self.count = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self.n
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, v):
+        self.buf[self.head] = v
+        self.buf[self.head + self.n] = v
+        self.head = (self.head + 1) % self.n
+        self.count = min(self.count + 1, self.n)
+
+    def _put(self, start, a):
+        # `a` fits without wrapping past the end of the first copy
+        end = start + a.size
+        self.buf[start:end] = a
+        self.buf[start + self.n:end + self.n] = a
+
+    def extend(self, values):
+        a = np.asarray(values, dtype=np.float32).ravel()
+        n = self.n
+        k = a.size
+        if k == 0:
+            return
+        if k >= n:
+            self._put(0, a[-n:])
+            self.head = 0
+            self.count = n
+            return
+        split = n - self.head
+        if k <= split:
+            self._put(self.head, a)
+        else:
+            self._put(self.head, a[:split])
+            self._put(0, a[split:])
+        self.head = (self.head + k) % n
+        self.count = min(self.count + k, n)
+
+    def view(self):
+        """Return the contents oldest-first as a zero-copy float32 view.
+
+        Only valid until the next append.
+        """
+        if self.count < self.n:
+            return self.buf[:self.count]
+        return self.buf[self.head:self.head + self.n]
+
+
+def _pack_bits_b64(bits) -> str:
+    """Pack 0/1 values into bytes (least-significant bit first, matching
+    `_unpack_bits_le`) and return them base64-encoded."""
+    arr = np.fromiter(bits, dtype=np.uint8)
+    return base64.b64encode(np.packbits(arr, bitorder='little').tobytes()).decode('ascii')
+
+
+@functools.lru_cache(maxsize=4)
+def _circle_mask(size: int):
+    """Rows of booleans marking the pixels inside the icon circle."""
+    r = size // 2
+    r2 = (r - 1) ** 2
+    return tuple(tuple((x - r) ** 2 + (y - r) ** 2 <= r2 for x in range(size))
+                 for y in range(size))
+
+
+@functools.lru_cache(maxsize=16)
+def _icon_data(color: str, bg: str, size: int) -> tuple:
+    """Tk photo data for a filled circle icon, as a tuple of row tuples.
+
+    tkinter hands nested tuples to Tcl as a list of lists directly, so the
+    single `put` call needs no string building on our side or parsing on Tk's.
+    """
+    return tuple(tuple(color if inside else bg for inside in row)
+                 for row in _circle_mask(size))
+
+
+def _png_chunk(tag: bytes, body: bytes) -> bytes:
+    return struct.pack('>I', len(body)) + tag + body + struct.pack('>I', zlib.crc32(tag + body))
+
+
+@functools.lru_cache(maxsize=16)
+def _icon_png(color: str, bg: str, size: int) -> str:
+    """Base64 PNG of a filled circle icon, for `tk.PhotoImage(data=...)`.
+
+    Tk decodes the few hundred bytes in one call instead of parsing a
+    per-pixel "{row} ..." string. `color`/`bg` must be '#rrggbb'.
+    """
+    fg_px = bytes.fromhex(color[1:])
+    bg_px = bytes.fromhex(bg[1:])
+    if len(fg_px) != 3 or len(bg_px) != 3:
+        raise ValueError(f'expected #rrggbb colours, got {color!r}/{bg!r}')
+    # 8-bit RGB scanlines, each prefixed with filter type 0 (none)
+    raw = b''.join(b'\x00' + b''.join(fg_px if inside else bg_px for inside in row)
+                   for row in _circle_mask(size))
+    png = (b'\x89PNG\r\n\x1a\n'
+           + _png_chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0))
+           + _png_chunk(b'IDAT', zlib.compress(raw, 9))
+           + _png_chunk(b'IEND', b''))
+    return base64.b64encode(png).decode('ascii')
+
+
+def _enable_setter(widget):
+    """Return a callable(on: bool) that enables or disables `widget`.
+
+    Resolved once per widget: ttk widgets use `state()`, classic Tk
+    widgets use `config(state=...)`.
+    """
+    if isinstance(widget, ttk.Widget):
+        return lambda on: widget.state(['!disabled' if on else 'disabled'])
+    return lambda on: widget.config(state='normal' if on else 'disabled')
+
+
+# Decoded contents of small static files keyed by path -> (mtime_ns, text)
+_TEXT_CACHE = {}
+
+
+def _read_cached(path: str) -> str:
+    """Return the UTF-8 text of `path`, re-reading only when its mtime changes.
+
+    The file is mapped read-only and decoded straight from the mapping, so no
+    intermediate bytes copy is made.
+    Raises OSError if the file cannot be opened.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    hit = _TEXT_CACHE.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                text = str(m, 'utf-8', 'replace')
+        except ValueError:
+            # mmap refuses empty files
+            text = ''
+    _TEXT_CACHE[path] = (mtime, text)
+    return text
+
+
+def _json_default(obj):
+    """`json.dumps` hook mirroring orjson's UTC datetime output."""
+    if isinstance(obj, datetime):
+        return obj.isoformat() + 'Z'
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _dumps_line(entry) -> bytes:
+    """Serialize `entry` to a newline-terminated UTF-8 JSON line.
+
+    Naive datetimes are treated as UTC and emitted with a trailing 'Z'.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
+        except Exception:
+            pass
+    return (json.dumps(entry, default=_json_default) + "\n").encode('utf-8')
+
+
+def _dumps_pretty(obj) -> bytes:
+    """Serialize `obj` to 2-space indented UTF-8 JSON.
+
+    Uses orjson when available (numpy scalars and arrays included); anything it
+    rejects falls back to stdlib json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except Exception:
+            pass
+    return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
 
 class ConsciousnessLab:
     def __init__(self):
@@ -69,23 +530,77 @@ class ConsciousnessLab:
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # Core components
-        self.coherence_queue = Queue()
+        # Bounded so a stalled consumer cannot grow it without limit; producers
+        # drop the oldest sample when it is full (see `put_dropping_oldest`)
+        self.coherence_queue = Queue(maxsize=_COHERENCE_QUEUE_MAX)
 #        self.hrv_manager = HRVDeviceManager()
 #        self.hrv_manager = HRVDeviceManager()
         self.hrv_manager = HRVDeviceManager(self.coherence_queue)  
         self.rng_collector = RNGCollector()
         # Start HRV -> RNG correlation consumer thread
+        # HRV samples waiting to be drawn; flushed by `_drain_ui_queue`
+        self._hrv_pending = deque()
+        # Lines currently shown in the HRV stream box (oldest first)
+        self._hrv_lines = deque(maxlen=200)
+        # Last few device coherence samples, kept by `_hrv_consumer` for `update_loop`;
+        # `_coherence_seq` is bumped whenever it changes. `_coherence_sum` is the
+        # running total over the window, so `_avg_coherence` costs O(1) per sample
+        self._recent_coherence = deque(maxlen=10)
+        self._coherence_sum = 0.0
+        self._avg_coherence = 0.0
+        self._coherence_seq = 0
+        # Extra listeners for live samples: queues that `_hrv_consumer` also
+        # puts each batch on (used by `test_hrv_stream` to wait without polling).
+        # Replaced rather than mutated, so the consumer can iterate it unlocked
+        self._coherence_taps = ()
+        # update_loop change tracking: last rendered widget options, the RNG mode
+        # the stats were computed for, and the last coherence update seen
+        self._rendered = {}
+        self._stats_seen = None
+        self._coherence_seen = 0
+        self._update_idle_ticks = 0
+        self._loop_interval = 100
+        # time.time() at which a timed session stops; None when untimed
+        self.session_end_time = None
+        # Whole seconds last shown on the countdown label
+        self._last_countdown = None
+        # Devices the HRV manager is monitoring (see `_refresh_device_count`)
+        self._connected_device_count = 0
+        self._device_count_text = "0 devices"
+        self._update_after_id = None
+        # Cached 'YYYY-MM-DDTHH:MM:SS' for the last whole second seen by `_format_hrv_ts`
+        self._last_ts_sec = None
+        self._last_ts_str = ''
         try:
             self._hrv_thread = threading.Thread(target=self._hrv_consumer, daemon=True)
             self._hrv_thread.start()
         except Exception:
             self._hrv_thread = None
         # Realtime HRV coherence history for sparkline
-        self._hrv_coherence_history = deque(maxlen=200)
+        self._hrv_coherence_history = _RingBuf(200)
+        # Plot x values for the history; rebuilt only when the length changes
+        self._hrv_x = np.arange(200, dtype=np.int32)
         self._hrv_sparkline_enabled = True
+        # Sparkline redraws are capped at ~15 Hz; a trailing redraw is scheduled when skipped
+        self._last_spark_draw_t = 0.0
+        self._spark_after_id = None
+        # (canvas, baseline_id, line_id, dot_id) reused across sparkline redraws
+        self._spark_items = None
+        # Matplotlib HRV plot redraws are capped at ~20 FPS the same way
+        self._hrv_last_draw = 0.0
+        self._hrv_plot_after_id = None
+        # At most one full figure redraw is queued at a time (see `_request_hrv_redraw`)
+        self._hrv_draw_pending = False
         self.group_manager = None
         # SDR instance placeholder (created lazily by provider)
         self._sdr_instance = None
+        # SDR producer thread (dongle reads) and its stop event while streaming
+        self._sdr_producer_thread = None
+        self._sdr_producer_stop = None
+        # Background sweep over fallback SDR init parameters (see `_try_init_sdr_async`)
+        self._sdr_init_thread = None
+        # Earliest time.monotonic() at which the provider recomputes the spectral peak
+        self._sdr_peak_next_ts = 0.0
         # Measured peak smoothing and spectral-enable flag
         self._sdr_measured_ema = None
         self._sdr_ema_alpha = 0.25
@@ -96,12 +611,85 @@ class ConsciousnessLab:
         self._sdr_fail_threshold = 3
         self._sdr_fail_backoff_secs = 300  # 5 minutes
         self._sdr_disabled_until = 0
+        # Last size applied to each named font by `_apply_ui_scale`
+        self._applied_font_sizes = {'title': None, 'header': None, 'stats': None, 'small': None}
+        # Shared pool for button-triggered workers (onboarding checks, diagnostics,
+        # exports, device scans). Bounded so rapid clicks queue up instead of
+        # spawning threads; these workers mostly wait on pkexec/subprocess/BLE calls
+        self._bg_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='mf-bg')
+        # Single worker for actions that change system or RNG state (Bluetooth
+        # toggle, SDR seeding, driver fixes/undo, rtl_test as root), so two of
+        # them never run at once and race on rfkill, modules or the status bar
+        self._serial_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='mf-serial')
+        self._bt_toggle_inflight = False
+        self._seed_inflight = False
+        # monotonic time of the last successful seed; reseeds within
+        # _RESEED_MIN_INTERVAL of it are skipped
+        self._last_seed_t = None
+        # monotonic time of the last click per action, for `_click_too_soon`
+        self._last_click = {}
+        # UI work posted by worker threads via `_ui`, run on the Tk thread by `_drain_ui_queue`
+        self._ui_q = Queue()
+        # Short-lived results of SDR/Bluetooth probes: key -> (monotonic time, result), see `_ttl`
+        self._check_cache_ttl = 10.0
+        self._ttl_cache = {}
+        # Help dialogs are created on first show and then withdrawn/re-shown
+        self._trouble_dlg = None
+        self._trouble_txt = None
+        self._trouble_sections = None
+        self._onboard_dlg = None
+        # Audit steps queued while inside `_audit_coalesce()`; None when not coalescing
+        self._audit_pending = None
+        # Cached BlueZ connection and adapter Powered values, kept current by
+        # PropertiesChanged signals when a GLib main loop is available
+        self._bus = None
+        self._bt_powered = {}
+        self._bt_signals = False
+        self._bt_glib_loop = None
+        self._bluez_props = None
+        self._bluez_props_path = None
+        # Async DBus connection and Adapter1 proxies keyed by path (see `_init_bt_aio_dbus`)
+        self._bt_aio_bus = None
+        self._bt_aio_adapters = {}
+        # Persistent asyncio loop for one-off bleak calls (BLE scans), so each
+        # scan does not build and tear down its own loop and BlueZ manager
+        self._aio_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._aio_loop.run_forever, name='mf-aio', daemon=True).start()
+        self._scanner = None
+        if AioMessageBus is not None:
+            # Connect in the background on the loop thread; state queries fall
+            # back to rfkill/bluetoothctl until the adapter table is filled
+            asyncio.run_coroutine_threadsafe(self._init_bt_aio_dbus(), self._aio_loop)
+        else:
+            self._init_bt_dbus()
         
         # State
         self.device_vars = []
+        # Addresses of checked devices, maintained by the checkbutton command
+        self._selected_addrs = set()
+        # Checkbutton variables by address, reused across rescans so each
+        # scan doesn't allocate a fresh Tcl variable per device
+        self._device_bool_vars = {}
         self.running = False
         self.session_data = []
         self.current_session_type = "individual"
+        # Widgets/plot objects created by setup_gui (None when unavailable) and
+        # resize bookkeeping; defined up front so hot paths use plain attribute access
+        self.action_frame = None
+        self.hrv_stream_box = None
+        self.hrv_spark_canvas = None
+        self.hrv_spark_label = None
+        self._hrv_fig = None
+        self._hrv_ax = None
+        self._hrv_line = None
+        self._hrv_canvas = None
+        # Axes background (without the HRV line) captured after each full draw, for blitting
+        self._hrv_bg = None
+        self._hrv_plot_paused = False
+        self._hrv_test_running = False
+        self._hrv_test_stop = None
+        self._resize_after_id = None
+        self._last_reflow_width = None
         
         self.setup_gui()
         # Honor environment override for admin mode on startup for testing
@@ -116,8 +704,84 @@ class ConsciousnessLab:
             pass
 
         self.update_loop()
+        self._drain_ui_queue()
         
 
+    def _ttl(self, key, ttl, fn):
+        """Return `fn()`, reusing the result cached under `key` if it is under `ttl` seconds old.
+
+        Exceptions are not cached. Drop a key with `self._ttl_cache.pop(key, None)`
+        when the probed state is known to have changed.
+        """
+        now = time.monotonic()
+        hit = self._ttl_cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        result = fn()
+        self._ttl_cache[key] = (now, result)
+        return result
+
+    def _sdr_available(self):
+        """`sdr_rng.is_sdr_available()` (probes USB), cached for a few seconds."""
+        def _probe():
+            if is_sdr_available is None:
+                return False
+            try:
+                return is_sdr_available()
+            except Exception:
+                return False
+        return self._ttl('sdr', 5.0, _probe)
+
+    def _click_too_soon(self, key, interval=0.25):
+        """True if the action `key` was also clicked less than `interval` seconds ago."""
+        now = time.monotonic()
+        last = self._last_click.get(key)
+        self._last_click[key] = now
+        return last is not None and now - last < interval
+
+    def _set_action_busy(self, btn, busy):
+        """Disable `btn` while its background action runs (Tk thread).
+
+        On completion the button is only re-enabled if Self-Admin mode has not
+        locked the action buttons in the meantime.
+        """
+        if not busy and getattr(self, 'admin_mode', 'external') == 'self':
+            return
+        try:
+            _enable_setter(btn)(not busy)
+        except Exception:
+            pass
+
+    def _ui(self, fn, *args, **kwargs):
+        """Queue `fn(*args, **kwargs)` to run on the Tk thread; safe to call from any thread."""
+        self._ui_q.put((fn, args, kwargs))
+
+    def _ui_dialog(self, kind, title, message):
+        """Queue `messagebox.<kind>(title, message)` for the Tk thread; for worker threads,
+        which must never open dialogs themselves."""
+        self._ui(getattr(messagebox, kind), title, message)
+
+    def _drain_ui_queue(self):
+        """Run the callables queued by `_ui` and flush pending HRV samples,
+        then poll again in 50 ms."""
+        q = self._ui_q
+        while True:
+            try:
+                fn, args, kwargs = q.get_nowait()
+            except Empty:
+                break
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                logger.exception('Queued UI update failed')
+        if self._hrv_pending:
+            self._flush_hrv()
+        try:
+            self.root.after(50, self._drain_ui_queue)
+        except tk.TclError:
+            # root destroyed during shutdown
+            pass
+
     def setup_gui(self):
         # Visual theme
         self.bg_color = "#f7f9fb"
@@ -153,24 +817,23 @@ class ConsciousnessLab:
 
         # Generate small circular icons for buttons (keeps references on self)
         self._icons = {}
+        # (color, size) -> PhotoImage, shared by every button using that icon
+        self._icon_cache = {}
         def _make_icon(color, size=16):
-            img = tk.PhotoImage(width=size, height=size)
-            r = size // 2
-            cx = cy = r
-            bg = self.bg_color
-            for x in range(size):
-                for y in range(size):
-                    # simple circle mask
-                    if (x - cx) ** 2 + (y - cy) ** 2 <= (r - 1) ** 2:
-                        try:
-                            img.put(color, (x, y))
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            img.put(bg, (x, y))
-                        except Exception:
-                            pass
+            key = (color, size)
+            img = self._icon_cache.get(key)
+            if img is not None:
+                return img
+            try:
+                img = tk.PhotoImage(data=_icon_png(color, self.bg_color, size), format='png')
+            except (tk.TclError, ValueError):
+                # Tk without PNG support or a non-hex colour: draw it pixel by pixel
+                img = tk.PhotoImage(width=size, height=size)
+                try:
+                    img.put(_icon_data(color, self.bg_color, size))
+                except Exception:
+                    pass
+            self._icon_cache[key] = img
             return img
 
         # make slightly smaller icons to match compact buttons
@@ -354,8 +1017,10 @@ class ConsciousnessLab:
                     ax.grid(True, linestyle=':', linewidth=0.5)
                     self._hrv_fig = fig
                     self._hrv_ax = ax
-                    self._hrv_line, = ax.plot([], [], color='#2c3e50', linewidth=1.5)
+                    # animated: excluded from full draws and blitted on top of the cached background
+                    self._hrv_line, = ax.plot([], [], color='#2c3e50', linewidth=1.5, animated=True)
                     self._hrv_canvas = FigureCanvasTkAgg(fig, master=plot_frame)
+                    self._hrv_canvas.mpl_connect('draw_event', self._on_hrv_draw_event)
                     self._hrv_canvas_widget = self._hrv_canvas.get_tk_widget()
                     self._hrv_canvas_widget.pack(side='left', fill='both', expand=True, padx=(0,6))
                     # For sparkline compatibility use hrv_spark_canvas==None (matplotlib used)
@@ -518,6 +1183,12 @@ class ConsciousnessLab:
         self.export_btn = ttk.Button(action_frame, text="Export Session", command=self.export_session)
         self.export_btn.pack(fill='x', pady=2)
 
+        # Enable/disable setters for buttons locked in Self-Admin mode
+        self._admin_toggle_btns = [_enable_setter(b) for b in (
+            self.baseline_btn, self.experiment_btn, self.mark_btn, self.group_btn,
+            self.export_btn, self.toggle_bt_btn, self.seed_btn, self.scan_btn)]
+        self._sdr_stream_btn_enable = _enable_setter(self.sdr_stream_btn)
+
         # Small status indicators (inside scrollable area)
         status_frame = tk.Frame(self.main_inner, bg=self.bg_color)
         status_frame.pack(fill='x', padx=20, pady=(4,0))
@@ -585,18 +1256,13 @@ class ConsciousnessLab:
         self.sdr_freq_label.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Show onboarding on first run
-        try:
-            seen_flag = os.path.join(os.getcwd(), '.mindfield_seen')
-            if not os.path.exists(seen_flag):
-                # show onboarding dialog and create flag
-                self.show_onboarding()
-                try:
-                    with open(seen_flag, 'w') as f:
-                        f.write('seen')
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        if not _SEEN_FLAG_PATH.exists():
+            # show onboarding dialog and create flag
+            self.show_onboarding()
+            try:
+                _mark_onboarding_seen()
+            except OSError:
+                pass
 
         # Tooltips
         try:
@@ -621,24 +1287,52 @@ class ConsciousnessLab:
         
     def scan_devices(self):
         self.status_bar.config(text="Scanning for HRV devices...")
-        
-        def scan_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                devices = loop.run_until_complete(self.hrv_manager.scan_devices())
-                self.root.after(0, lambda: self.display_devices(devices))
-            except Exception as e:
-                msg = "Enable Bluetooth to scan" if "bluez" in str(e).lower() else f"Scan failed: {e}"
-                self.root.after(0, lambda: self.show_error(msg))
-                
-        threading.Thread(target=scan_async, daemon=True).start()
+        # Runs on the shared asyncio loop; no worker thread sits waiting for it
+        try:
+            fut = asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(self.hrv_manager.scan_devices(), 15), self._aio_loop)
+        except Exception as e:
+            self.show_error(f"Scan failed: {e}")
+            return
+        fut.add_done_callback(self._on_scan_done)
+
+    def _on_scan_done(self, fut):
+        """Done-callback for `scan_devices` (asyncio loop thread); hands off to Tk."""
+        try:
+            devices = fut.result()
+        except Exception as e:
+            msg = "Enable Bluetooth to scan" if "bluez" in str(e).lower() else f"Scan failed: {e}"
+            self._ui(self.show_error, msg)
+            return
+        self._ui(self.display_devices, devices)
+
+    def _run_async(self, coro, timeout=None):
+        """Run `coro` on the shared asyncio loop thread and wait for its result."""
+        fut = asyncio.run_coroutine_threadsafe(coro, self._aio_loop)
+        try:
+            return fut.result(timeout)
+        except concurrent.futures.TimeoutError:
+            fut.cancel()
+            raise
+
+    async def _ble_discover(self, timeout):
+        """Scan for advertising BLE devices with a reused `BleakScanner` (runs on `_aio_loop`)."""
+        from bleak import BleakScanner
+        if self._scanner is None:
+            self._scanner = BleakScanner()
+        await self._scanner.start()
+        try:
+            await asyncio.sleep(timeout)
+        finally:
+            await self._scanner.stop()
+        return self._scanner.discovered_devices
         
     def display_devices(self, devices):
         # Clear previous
         for widget in self.device_list.winfo_children():
             widget.destroy()
         self.device_vars = []
+        self._selected_addrs = set()
         
         if not devices:
             tk.Label(self.device_list, text="No devices found", fg="#95a5a6").pack()
@@ -646,15 +1340,34 @@ class ConsciousnessLab:
         else:
             self.status_bar.config(text=f"Found {len(devices)} device(s)")
             for dev in devices:
-                var = tk.BooleanVar()
+                var = self._device_bool_vars.get(dev['address'])
+                if var is None:
+                    var = self._device_bool_vars[dev['address']] = tk.BooleanVar()
+                else:
+                    # Selection was cleared above; keep the box in step
+                    var.set(False)
                 cb = tk.Checkbutton(self.device_list, 
                                   text=f"{dev['name']} ({dev['address'][-5:]}) [{dev['rssi']}dB]",
-                                  variable=var)
+                                  variable=var,
+                                  command=functools.partial(self._on_device_toggled, dev['address'], var))
                 cb.pack(anchor='w')
                 self.device_vars.append((var, dev['address'], dev['name']))
                 
+    def _on_device_toggled(self, addr, var):
+        """Checkbutton command: keep `_selected_addrs` in step with the box."""
+        if var.get():
+            self._selected_addrs.add(addr)
+        else:
+            self._selected_addrs.discard(addr)
+
+    def _selected_devices(self):
+        """Return (address, name) for the checked devices, in scan order,
+        without reading each Tk variable."""
+        sel = self._selected_addrs
+        return [(addr, name) for _, addr, name in self.device_vars if addr in sel]
+
     def start_group_session(self):
-        selected = [(addr, name) for var, addr, name in self.device_vars if var.get()]
+        selected = self._selected_devices()
         if not selected:
             messagebox.showinfo("No Devices", "Select HRV devices first")
             return
@@ -667,7 +1380,7 @@ class ConsciousnessLab:
             self.setup_participant_display(assignments['participants'])
             
             # Connect devices
-            self.hrv_manager.connect_devices(list(assignments['participants'].keys()))
+            self._connect_hrv_devices(list(assignments['participants'].keys()))
             # If in external admin mode, show subject info (first participant)
             try:
                 if getattr(self, 'admin_mode', 'external') == 'external':
@@ -682,43 +1395,70 @@ class ConsciousnessLab:
 
             self.toggle_session("experiment")
 
+    def _connect_hrv_devices(self, addresses):
+        """Start monitoring `addresses` and refresh the device count shown in
+        the coherence summary."""
+        self.hrv_manager.connect_devices(addresses)
+        self._refresh_device_count()
+
+    def _refresh_device_count(self, gone=()):
+        """Recount the devices the HRV manager is monitoring for `update_loop`.
+
+        `gone` lists addresses that just reported a final error; the manager
+        only drops them from `active_devices` after queueing that sample.
+        """
+        try:
+            n = len(set(self.hrv_manager.active_devices) - set(gone))
+        except Exception:
+            return
+        self._connected_device_count = n
+        self._device_count_text = f"{n} device{'s' if n != 1 else ''}"
+
     def test_hrv_stream(self):
         """Check if selected HRV devices are transmitting RR/HR data.
 
         Connects to selected devices (if not already connected), waits up to
         `timeout` seconds for incoming data, and shows a summary dialog.
         """
-        selected = [addr for var, addr, _ in self.device_vars if var.get()]
+        selected = [addr for addr, _ in self._selected_devices()]
         if not selected:
             messagebox.showinfo("No Devices", "Select HRV devices first")
             return
 
         def worker():
-            self.root.after(0, lambda: self.status_bar.config(text="Testing HRV streams..."))
+            self._ui(self.status_bar.config, text="Testing HRV streams...")
             logger.info('HRV stream test started for: %s', selected)
 
             # Ensure devices are being monitored
             try:
-                self.hrv_manager.connect_devices(selected)
+                self._connect_hrv_devices(selected)
             except Exception:
                 logger.exception('Failed to start HRV connect')
 
+            # Wait on live samples from the HRV consumer; returns as soon as a
+            # selected device reports instead of polling once a second
             found = {}
             timeout = 12
-            start = time.time()
-            while time.time() - start < timeout:
-                try:
-                    data = self.hrv_manager.get_all_coherence()
-                    for entry in data:
+            deadline = time.monotonic() + timeout
+            tap = Queue()
+            self._coherence_taps = self._coherence_taps + (tap,)
+            try:
+                while not found:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch = tap.get(timeout=remaining)
+                    except Empty:
+                        break
+                    for entry in batch:
                         addr = entry.get('device')
                         if addr in selected:
-                            # record latest sample
                             found.setdefault(addr, []).append(entry)
-                    if found:
-                        break
-                except Exception:
-                    logger.exception('Error reading HRV coherence')
-                time.sleep(1)
+            except Exception:
+                logger.exception('Error reading HRV coherence')
+            finally:
+                self._coherence_taps = tuple(t for t in self._coherence_taps if t is not tap)
 
             # Prepare result text
             if not found:
@@ -741,33 +1481,43 @@ class ConsciousnessLab:
                     dlg.title("HRV Stream Test Results")
                     dlg.geometry("540x240")
                     st = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
-                    st.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-                    st.insert(tk.END, txt + "\n\nRaw samples (latest per device):\n")
+                    parts = [txt, "\n\nRaw samples (latest per device):\n"]
                     for addr, samples in found.items():
-                        st.insert(tk.END, f"--- {addr} ({len(samples)} samples) ---\n")
-                        for s in samples[-5:]:
-                            st.insert(tk.END, json.dumps(s) + "\n")
+                        parts.append(f"--- {addr} ({len(samples)} samples) ---\n")
+                        parts.extend(json.dumps(s) + "\n" for s in samples[-5:])
+                    st.insert('1.0', ''.join(parts))
                     st.configure(state=tk.DISABLED)
+                    st.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
                     tk.Button(dlg, text="Close", command=dlg.destroy).pack(pady=6)
                 except Exception:
-                    messagebox.showinfo("HRV Test", txt)
+                    self._ui_dialog('showinfo', "HRV Test", txt)
 
-            self.root.after(0, _show)
+            self._ui(_show)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._bg_pool.submit(worker)
 
     def bt_debug(self):
         """Run bluetooth diagnostics (bluetoothctl show, rfkill list) with timeouts and show results."""
         def worker():
-            self.root.after(0, lambda: self.status_bar.config(text="Running BT diagnostics..."))
+            self._ui(self.status_bar.config, text="Running BT diagnostics...")
             out_lines = []
-            # If dbus/BlueZ available, try to list adapters and powered state
-            if dbus is not None:
+            # List adapters and powered state: async DBus proxies when connected,
+            # otherwise dbus-python if available
+            if self._bt_aio_adapters:
                 try:
-                    try:
-                        system_bus = dbus.SystemBus()
-                    except Exception:
-                        system_bus = None
+                    adapter_info = self._run_async(self._bt_aio_adapter_info(), timeout=5)
+                    if adapter_info:
+                        out_lines.append(('bluez dbus adapters', '\n'.join(adapter_info)))
+                except Exception:
+                    logger.exception('Error reading BlueZ adapters via async DBus')
+            elif dbus is not None:
+                try:
+                    system_bus = self._bus
+                    if system_bus is None:
+                        try:
+                            system_bus = dbus.SystemBus()
+                        except Exception:
+                            system_bus = None
                     if system_bus is not None:
                         try:
                             manager = dbus.Interface(
@@ -791,7 +1541,7 @@ class ConsciousnessLab:
             try:
                 # bluetoothctl show
                 try:
-                    res = subprocess.run(["bluetoothctl", "show"], capture_output=True, text=True, timeout=5)
+                    res = _run_killable(_BTCTL + ["show"], timeout=5)
                     out_lines.append(('bluetoothctl show', res.stdout or res.stderr))
                     logger.debug('bluetoothctl show: %s', res.stdout)
                 except subprocess.TimeoutExpired:
@@ -803,7 +1553,7 @@ class ConsciousnessLab:
 
                 # rfkill list bluetooth
                 try:
-                    res = subprocess.run(["rfkill", "list", "bluetooth"], capture_output=True, text=True, timeout=5)
+                    res = _run_killable(["rfkill", "list", "bluetooth"], timeout=5)
                     out_lines.append(('rfkill list bluetooth', res.stdout or res.stderr))
                     logger.debug('rfkill output: %s', res.stdout)
                 except subprocess.TimeoutExpired:
@@ -832,18 +1582,16 @@ class ConsciousnessLab:
                     dlg.title('BT Diagnostics')
                     dlg.geometry('700x420')
                     txt = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
-                    txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-                    for title, content in out_lines:
-                        txt.insert(tk.END, f"=== {title} ===\n")
-                        txt.insert(tk.END, (content or '').strip() + "\n\n")
+                    txt.insert('1.0', ''.join(f"=== {title} ===\n{(content or '').strip()}\n\n" for title, content in out_lines))
                     txt.configure(state=tk.DISABLED)
+                    txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
                     tk.Button(dlg, text='Close', command=dlg.destroy).pack(pady=6)
                 except Exception:
-                    messagebox.showinfo('BT Diagnostics', '\n'.join([f"{t}: {c}" for t, c in out_lines]))
+                    self._ui_dialog('showinfo', 'BT Diagnostics', '\n'.join([f"{t}: {c}" for t, c in out_lines]))
 
-            self.root.after(0, _show)
+            self._ui(_show)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._bg_pool.submit(worker)
             
     def setup_participant_display(self, participants):
         # Show participant frame
@@ -880,10 +1628,11 @@ class ConsciousnessLab:
                     pass
             # For individual sessions, connect selected devices
             if self.current_session_type == "individual":
-                selected = [addr for var, addr, _ in self.device_vars if var.get()]
-                selected_names = [name for var, addr, name in self.device_vars if var.get()]
+                chosen = self._selected_devices()
+                selected = [addr for addr, _ in chosen]
+                selected_names = [name for _, name in chosen]
                 if selected:
-                    self.hrv_manager.connect_devices(selected)
+                    self._connect_hrv_devices(selected)
                     self.status_bar.config(text=f"Connected to {len(selected)} device(s)")
                     # If in external admin mode, show the subject name
                     try:
@@ -895,6 +1644,8 @@ class ConsciousnessLab:
             # Start RNG collection
             self.running = True
             self.rng_collector.start(mode)
+            # The idle loop may be up to a second away; refresh as soon as Tk is idle
+            self._kick_update_loop()
 
             # Indicate RNG is active
             try:
@@ -981,7 +1732,8 @@ class ConsciousnessLab:
             # cancelled
             return
 
-        coherence_data = self.hrv_manager.get_all_coherence()
+        # Latest device samples as kept by the HRV consumer
+        coherence_data = list(self._recent_coherence)
         try:
             self.rng_collector.mark_event("intention", coherence_data, meta={'intent': intent})
         except TypeError:
@@ -1044,68 +1796,94 @@ class ConsciousnessLab:
         self.root.wait_window(dlg)
         return result['val']
         
+    def _config_if_changed(self, widget, **options):
+        """`widget.config(**options)` unless those exact options were the last ones set
+        through this helper, saving Tk a redundant reconfigure/redraw."""
+        key = str(widget)
+        if self._rendered.get(key) == options:
+            return
+        widget.config(**options)
+        self._rendered[key] = options
+
     def update_loop(self):
+        changed = False
         if self.running:
-            # Get RNG stats
-            stats = self.rng_collector.get_stats()
-            
-            # Update main stats
-            self.stats_label.config(
-                text=f"Mean: {stats['mean']:.4f} | Z-score: {stats['z_score']:+.3f} | Bits: {stats['count']:,}"
-            )
-            
-            # Color code z-score
-            if abs(stats['z_score']) > 3:
-                self.stats_label.config(fg="#e74c3c")  # Red for high significance
-            elif abs(stats['z_score']) > 2:
-                self.stats_label.config(fg="#f39c12")  # Orange for significant
-            else:
-                self.stats_label.config(fg="black")
-            
-            # Update effect size if available
-            comparison = self.rng_collector.get_baseline_comparison()
-            if comparison:
-                self.effect_label.config(
-                    text=f"Effect: {comparison['effect_percent']:+.2f}% from baseline",
-                    fg="#e74c3c" if abs(comparison['effect_percent']) > 1 else "#7f8c8d"
+            # Stats only change when bits arrive or the mode flips
+            mode = self.rng_collector.mode
+            if self.rng_collector.has_new_data() or mode != self._stats_seen:
+                self._stats_seen = mode
+                changed = True
+                # Get RNG stats
+                stats = self.rng_collector.get_stats()
+
+                # Update main stats; color code z-score
+                if abs(stats['z_score']) > 3:
+                    fg = "#e74c3c"  # Red for high significance
+                elif abs(stats['z_score']) > 2:
+                    fg = "#f39c12"  # Orange for significant
+                else:
+                    fg = "black"
+                self._config_if_changed(
+                    self.stats_label,
+                    text=f"Mean: {stats['mean']:.4f} | Z-score: {stats['z_score']:+.3f} | Bits: {stats['count']:,}",
+                    fg=fg
                 )
-            
-            # Update coherence
-            coherence_data = self.hrv_manager.get_all_coherence()
-            if coherence_data:
-                # Group session - show individual coherence
-                if self.current_session_type == "group" and hasattr(self.hrv_manager, 'device_names'):
-                    for data in coherence_data:
-                        addr = data.get('device')
-                        if addr in self.participant_labels:
-                            self.participant_labels[addr].config(
-                                text=f"Coherence: {data['coherence']:.3f}"
+
+                # Update effect size if available
+                comparison = self.rng_collector.get_baseline_comparison()
+                if comparison:
+                    self._config_if_changed(
+                        self.effect_label,
+                        text=f"Effect: {comparison['effect_percent']:+.2f}% from baseline",
+                        fg="#e74c3c" if abs(comparison['effect_percent']) > 1 else "#7f8c8d"
+                    )
+
+            # Update coherence from samples kept by the HRV consumer thread
+            seq = self._coherence_seq
+            if seq != self._coherence_seen:
+                self._coherence_seen = seq
+                changed = True
+                coherence_data = list(self._recent_coherence)
+                if coherence_data:
+                    # Group session - show individual coherence
+                    if self.current_session_type == "group" and self.hrv_manager.device_names:
+                        # newest sample per participant wins; one config per label at most
+                        pending = {}
+                        for data in coherence_data:
+                            addr = data.get('device')
+                            if addr in self.participant_labels:
+                                pending[addr] = data['coherence']
+                        for addr, coh in pending.items():
+                            self._config_if_changed(
+                                self.participant_labels[addr],
+                                text=f"Coherence: {coh:.3f}"
                             )
-                
-                # Overall coherence
-                avg_coherence = sum(d['coherence'] for d in coherence_data) / len(coherence_data)
-                device_count = len(set(d['device'] for d in coherence_data))
-                self.coherence_label.config(
-                    text=f"Avg Coherence: {avg_coherence:.3f} ({device_count} device{'s' if device_count != 1 else ''})"
-                )
-                
-                # Auto-mark high coherence
-                if avg_coherence > 0.8 and self.rng_collector.mode == "experiment":
-                    self.rng_collector.mark_event("high_coherence", coherence_data)
-            
+
+                    # Overall coherence
+                    avg_coherence = self._avg_coherence
+                    self._config_if_changed(
+                        self.coherence_label,
+                        text=f"Avg Coherence: {avg_coherence:.3f} ({self._device_count_text})"
+                    )
+
+                    # Auto-mark high coherence
+                    if avg_coherence > 0.8 and self.rng_collector.mode == "experiment":
+                        self.rng_collector.mark_event("high_coherence", coherence_data)
+
             # Check session time limit
-            if hasattr(self, 'session_end_time') and self.session_end_time:
+            if self.session_end_time:
                 remaining = int(self.session_end_time - time.time())
                 if remaining <= 0:
                     # Time's up
                     if self.running:
                         self.stop_session()
                         self.status_bar.config(text="Session ended (time limit)")
-                else:
-                    mins = remaining // 60
-                    secs = remaining % 60
+                elif remaining != self._last_countdown:
+                    # Only reformat when the displayed second actually ticks over
+                    self._last_countdown = remaining
+                    mins, secs = divmod(remaining, 60)
                     try:
-                        self.countdown_label.config(text=f"Time left: {mins:02d}:{secs:02d}")
+                        self._config_if_changed(self.countdown_label, text=f"Time left: {mins:02d}:{secs:02d}")
                     except Exception:
                         pass
                     
@@ -1127,7 +1905,7 @@ class ConsciousnessLab:
                     last_t = getattr(self, '_sdr_throughput_last_time', None)
                     last_count = getattr(self, '_sdr_last_bits_count', None)
                     if last_t is None or last_count is None:
-                        self.sdr_freq_label.config(text=freq_text)
+                        self._config_if_changed(self.sdr_freq_label, text=freq_text)
                         # Initialize snapshots
                         self._sdr_last_bits_count = len(self.rng_collector.bits)
                         self._sdr_throughput_last_time = now
@@ -1152,19 +1930,19 @@ class ConsciousnessLab:
                                 freq_label = f"SDR peak: {display_mhz:.3f} MHz"
                             except Exception:
                                 freq_label = freq_text
-                            self.sdr_freq_label.config(text=f"{freq_label} | {rate:.1f} bits/s")
+                            self._config_if_changed(self.sdr_freq_label, text=f"{freq_label} | {rate:.1f} bits/s")
                         else:
-                            self.sdr_freq_label.config(text=f"{freq_text} | {rate:.1f} bits/s")
+                            self._config_if_changed(self.sdr_freq_label, text=f"{freq_text} | {rate:.1f} bits/s")
                         self._sdr_last_bits_count = len(self.rng_collector.bits)
                         self._sdr_throughput_last_time = now
                 except Exception:
                     try:
-                        self.sdr_freq_label.config(text=freq_text)
+                        self._config_if_changed(self.sdr_freq_label, text=freq_text)
                     except Exception:
                         pass
             else:
                 try:
-                    self.sdr_freq_label.config(text="SDR freq: --")
+                    self._config_if_changed(self.sdr_freq_label, text="SDR freq: --")
                 except Exception:
                     pass
         except Exception:
@@ -1180,10 +1958,7 @@ class ConsciousnessLab:
                     self._sdr_disabled_until = 0
                     try:
                         self.sdr_stream_btn.config(text="  Start SDR Stream")
-                        try:
-                            self.sdr_stream_btn.state(['!disabled'])
-                        except Exception:
-                            self.sdr_stream_btn.config(state='normal')
+                        self._sdr_stream_btn_enable(True)
                     except Exception:
                         pass
                     self.status_bar.config(text="SDR controls re-enabled")
@@ -1192,15 +1967,38 @@ class ConsciousnessLab:
         except Exception:
             pass
 
-        self.root.after(100, self.update_loop)
+        # 10 Hz during a session, backing off to 5 Hz once nothing has changed
+        # for a second; 1 Hz when no session is running
+        self._update_idle_ticks = 0 if changed else self._update_idle_ticks + 1
+        if not self.running:
+            interval = 1000
+        elif self._update_idle_ticks >= 10:
+            interval = 200
+        else:
+            interval = 100
+        self._loop_interval = interval
+        self._update_after_id = self.root.after(interval, self.update_loop)
+
+    def _kick_update_loop(self):
+        """Run `update_loop` at the next idle point instead of waiting out the
+        current (possibly 1 s) interval."""
+        try:
+            if self._update_after_id is not None:
+                self.root.after_cancel(self._update_after_id)
+            self._update_idle_ticks = 0
+            self._update_after_id = self.root.after_idle(self.update_loop)
+        except Exception:
+            pass
         
     def export_session(self):
         if not self.rng_collector.bits and not self.rng_collector.baseline_bits:
             messagebox.showinfo("No Data", "No session data to export")
             return
             
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"mindfield_{self.rng_collector.mode}_{timestamp}.csv"
+        # One clock read for the file name and both report formats
+        now = datetime.now()
+        ts_compact = now.strftime("%Y%m%d_%H%M%S")
+        filename = f"mindfield_{self.rng_collector.mode}_{ts_compact}.csv"
         
         filepath = filedialog.asksaveasfilename(
             defaultextension=".csv",
@@ -1211,89 +2009,141 @@ class ConsciousnessLab:
         if not filepath:
             return
             
-        stats = self.rng_collector.get_stats()
-        comparison = self.rng_collector.get_baseline_comparison()
-        
-        if filepath.endswith('.json'):
-            # JSON export with full data
-            data = {
-                'session_info': {
-                    'timestamp': datetime.now().isoformat(),
-                    'mode': self.rng_collector.mode,
-                    'duration_seconds': stats['count'] * 0.01,
-                    'type': self.current_session_type
-                },
-                'statistics': stats,
-                'comparison': comparison,
-                # Respect admin mode: if in self-admin, don't include raw bits or detailed markers
-                'markers': (self.rng_collector.markers if getattr(self, 'admin_mode', 'external') == 'external' else [{'count': len(self.rng_collector.markers)}]),
-                'raw_bits': (list(self.rng_collector.bits)[-10000:] if getattr(self, 'admin_mode', 'external') == 'external' else None),
-                'hrv_snapshots': (list(self.rng_collector.hrv_snapshots) if getattr(self, 'admin_mode', 'external') == 'external' else None)
-            }
-            
-            # Add group session data if applicable
-            if self.current_session_type == "group" and self.group_manager:
-                data['group_info'] = self.group_manager.device_assignments
-                
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-        else:
-            # CSV export summary
-            with open(filepath, 'w', newline='') as f:
-                writer = csv.writer(f)
-                
-                # Header info
-                writer.writerow(['Session Report - mindfield-core'])
-                writer.writerow(['Timestamp', datetime.now()])
-                writer.writerow(['Mode', self.rng_collector.mode])
-                writer.writerow(['Type', self.current_session_type])
-                writer.writerow([])
-                
-                # Statistics
-                writer.writerow(['Statistics'])
-                writer.writerow(['Mean', stats['mean']])
-                writer.writerow(['Z-score', stats['z_score']])
-                writer.writerow(['Total Bits', stats['count']])
-                writer.writerow(['Markers', stats['markers']])
-                
-                if comparison:
-                    writer.writerow([])
-                    writer.writerow(['Baseline Comparison'])
-                    writer.writerow(['Baseline Mean', comparison['baseline_mean']])
-                    writer.writerow(['Experiment Mean', comparison['experiment_mean']])
-                    writer.writerow(['Effect Size', f"{comparison['effect_percent']:.2f}%"])
-                    
-                # Markers
-                if self.rng_collector.markers:
-                    writer.writerow([])
-                    writer.writerow(['Event Markers'])
-                    writer.writerow(['Time', 'Event', 'Bit Index'])
-                    # Respect admin mode: redact detailed markers if self-admin
-                    if getattr(self, 'admin_mode', 'external') == 'external':
-                        for m in self.rng_collector.markers:
-                            writer.writerow([m.get('timestamp'), m.get('event'), m.get('bit_index')])
-                    else:
-                        writer.writerow(['(redacted in self-admin mode)', '', ''])
-                # HRV snapshots
-                if getattr(self.rng_collector, 'hrv_snapshots', None):
+        # Snapshot everything on the Tk thread (cheap copies), then write the
+        # file on the background pool so a large export does not stall the UI
+        admin_mode = getattr(self, 'admin_mode', 'external')
+        external = admin_mode == 'external'
+        bits = self.rng_collector.bits
+        group = self.group_manager if self.current_session_type == "group" else None
+        snap = {
+            'ts_iso': now.isoformat(timespec='seconds'),
+            'mode': self.rng_collector.mode,
+            'type': self.current_session_type,
+            'stats': self.rng_collector.get_stats(),
+            'comparison': self.rng_collector.get_baseline_comparison(),
+            'external': external,
+            'markers': list(self.rng_collector.markers),
+            # newest 10000 bits without copying the whole deque first
+            'raw_bits': (list(itertools.islice(reversed(bits), 10000))[::-1] if external else None),
+            # self-admin exports redact the snapshots, so only their count is needed
+            'hrv_snapshots': (list(self.rng_collector.hrv_snapshots) if external else None),
+            'hrv_count': len(self.rng_collector.hrv_snapshots),
+            # copied so the worker never reads live group-manager state
+            'group_info': (dict(group.device_assignments) if group else None),
+        }
+        self.status_bar.config(text=f"Exporting session to {filepath}...")
+        fut = self._bg_pool.submit(self._write_session_export, filepath, snap)
+        fut.add_done_callback(lambda f: self._ui(
+            self._on_session_export_done, filepath, f.exception(), group, admin_mode))
+
+    def _write_session_export(self, filepath, snap):
+        """Write a session export prepared by `export_session` (runs on `_bg_pool`).
+
+        Only touches the snapshot dict, never Tk or live collector state.
+        """
+        try:
+            stats = snap['stats']
+            comparison = snap['comparison']
+            external = snap['external']
+            if filepath.endswith('.json'):
+                # JSON export with full data
+                data = {
+                    'session_info': {
+                        'timestamp': snap['ts_iso'],
+                        'mode': snap['mode'],
+                        'duration_seconds': stats['count'] * 0.01,
+                        'type': snap['type']
+                    },
+                    'statistics': stats,
+                    'comparison': comparison,
+                    # Respect admin mode: if in self-admin, don't include raw bits or detailed markers
+                    'markers': (snap['markers'] if external else [{'count': len(snap['markers'])}]),
+                    # bits packed 8 per byte (LSB first) and base64-encoded; the
+                    # count says how many bits of the last byte are real
+                    'raw_bits_b64': (_pack_bits_b64(snap['raw_bits']) if snap['raw_bits'] is not None else None),
+                    'raw_bits_count': (len(snap['raw_bits']) if snap['raw_bits'] is not None else None),
+                    # the cached 'rr_intervals_json' duplicates rr_intervals; keep it out of the JSON
+                    'hrv_snapshots': ([{k: v for k, v in s.items() if k != 'rr_intervals_json'}
+                                       for s in snap['hrv_snapshots']]
+                                      if external else None)
+                }
+
+                # Add group session data if applicable
+                if snap['group_info'] is not None:
+                    data['group_info'] = snap['group_info']
+
+                payload = _dumps_pretty(data)
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
+            else:
+                # CSV export summary
+                with open(filepath, 'w', newline='', buffering=1 << 20) as f:
+                    writer = csv.writer(f)
+
+                    # Header info
+                    writer.writerow(['Session Report - mindfield-core'])
+                    writer.writerow(['Timestamp', snap['ts_iso']])
+                    writer.writerow(['Mode', snap['mode']])
+                    writer.writerow(['Type', snap['type']])
                     writer.writerow([])
-                    writer.writerow(['HRV Snapshots'])
-                    writer.writerow(['timestamp', 'device', 'heart_rate', 'coherence', 'bit_index', 'rr_intervals'])
-                    if getattr(self, 'admin_mode', 'external') == 'external':
-                        for s in self.rng_collector.hrv_snapshots:
-                            writer.writerow([s.get('timestamp'), s.get('device'), s.get('heart_rate'), s.get('coherence'), s.get('bit_index'), json.dumps(s.get('rr_intervals'))])
-                    else:
-                        writer.writerow(['(redacted in self-admin mode)'])
-                        
+
+                    # Statistics
+                    writer.writerow(['Statistics'])
+                    writer.writerow(['Mean', stats['mean']])
+                    writer.writerow(['Z-score', stats['z_score']])
+                    writer.writerow(['Total Bits', stats['count']])
+                    writer.writerow(['Markers', stats['markers']])
+
+                    if comparison:
+                        writer.writerow([])
+                        writer.writerow(['Baseline Comparison'])
+                        writer.writerow(['Baseline Mean', comparison['baseline_mean']])
+                        writer.writerow(['Experiment Mean', comparison['experiment_mean']])
+                        writer.writerow(['Effect Size', f"{comparison['effect_percent']:.2f}%"])
+
+                    # Markers
+                    if snap['markers']:
+                        writer.writerow([])
+                        writer.writerow(['Event Markers'])
+                        writer.writerow(['Time', 'Event', 'Bit Index'])
+                        # Respect admin mode: redact detailed markers if self-admin
+                        if external:
+                            writer.writerows((m.get('timestamp'), m.get('event'), m.get('bit_index'))
+                                             for m in snap['markers'])
+                        else:
+                            writer.writerow(['(redacted in self-admin mode)', '', ''])
+                    # HRV snapshots
+                    if snap['hrv_count']:
+                        writer.writerow([])
+                        writer.writerow(['HRV Snapshots'])
+                        writer.writerow(_HRV_CSV_HEADER)
+                        if external:
+                            f.writelines(_hrv_csv_lines(snap['hrv_snapshots']))
+                        else:
+                            writer.writerow(['(redacted in self-admin mode)'])
+        except Exception:
+            logger.exception('Session export failed')
+            raise
+
+    def _on_session_export_done(self, filepath, error, group, admin_mode):
+        """Main thread: finish an export written by `_write_session_export`."""
+        if error is not None:
+            self.status_bar.config(text="Export failed")
+            messagebox.showerror("Export", f"Export failed: {error}")
+            return
         # Save group metadata if group session
-        if self.current_session_type == "group" and self.group_manager:
-            self.group_manager.save_session_metadata(filepath)
+        if group is not None:
+            try:
+                group.save_session_metadata(filepath)
+            except Exception:
+                logger.exception('Saving group session metadata failed')
         # Audit export action
         try:
             who = getpass.getuser()
-            self._audit_event('export-session', {'user': who, 'filepath': filepath, 'mode': getattr(self, 'admin_mode', 'external')})
+            self._audit_event('export-session', {'user': who, 'filepath': filepath, 'mode': admin_mode})
         except Exception:
             pass
+        self.status_bar.config(text=f"Session data saved to {filepath}")
         messagebox.showinfo("Exported", f"Session data saved to {filepath}")
         
     def show_error(self, message):
@@ -1315,17 +2165,19 @@ class ConsciousnessLab:
         except Exception:
             pass
 
-    def _run_with_possible_privilege(self, cmd, timeout=None):
+    def _run_with_possible_privilege(self, cmd, timeout=None, input=None):
         """Run `cmd` (a list) and if it fails due to permission, ask the user
         on the main thread to authorize and re-run via `pkexec` (or `sudo` fallback).
 
+        `input`, if given, is passed to the command's stdin on every attempt.
+
         This helper may block the calling thread while waiting for the main
         thread to perform the privileged call; it's safe to call from a
         background worker.
         Returns a subprocess.CompletedProcess-like object.
         """
         try:
-            res = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+            res = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, input=input)
         except Exception as e:
             # Could not run even the non-privileged command
             logger.exception('Failed to run command: %s', cmd)
@@ -1339,13 +2191,11 @@ class ConsciousnessLab:
             logger.debug('Command succeeded: %s', cmd)
             return res
 
-        out = (res.stderr or "") + (res.stdout or "")
-        low = out.lower()
-
-        # Heuristic: permission errors include 'permission', 'denied', 'not authorized'
-        if any(x in low for x in ("permission", "denied", "not authorized", "authorization")):
+        # Heuristic: permission errors include 'permission', 'denied', 'not authorized'.
+        # Scan each stream separately so no combined/lowercased copy is built.
+        if _looks_perm(res.stderr) or _looks_perm(res.stdout):
             q = Queue()
-            logger.debug('Permission-like error detected for cmd %s: %s', cmd, out)
+            logger.debug('Permission-like error detected for cmd %s: %s%s', cmd, res.stderr or '', res.stdout or '')
 
             def _ask_and_run():
                 try:
@@ -1363,7 +2213,7 @@ class ConsciousnessLab:
                 try:
                     pcmd = ['pkexec'] + cmd
                     logger.debug('Attempting pkexec for: %s', cmd)
-                    r2 = subprocess.run(pcmd, capture_output=True, text=True, timeout=timeout)
+                    r2 = subprocess.run(pcmd, capture_output=True, text=True, timeout=timeout, input=input)
                     logger.debug('pkexec result: %s', getattr(r2, 'returncode', None))
                     q.put(r2)
                     return
@@ -1379,7 +2229,7 @@ class ConsciousnessLab:
                 try:
                     scmd = ['sudo'] + cmd
                     logger.debug('Attempting sudo for: %s', cmd)
-                    r3 = subprocess.run(scmd, capture_output=True, text=True, timeout=timeout)
+                    r3 = subprocess.run(scmd, capture_output=True, text=True, timeout=timeout, input=input)
                     logger.debug('sudo result: %s', getattr(r3, 'returncode', None))
                     q.put(r3)
                     return
@@ -1389,13 +2239,30 @@ class ConsciousnessLab:
 
             # Schedule the authorization on the main thread so messagebox and polkit dialogs can appear
             try:
-                self.root.after(0, _ask_and_run)
+                self._ui(_ask_and_run)
                 return q.get()
             except Exception as e:
                 return subprocess.CompletedProcess(cmd, 1, stdout="", stderr=str(e))
 
         return res
 
+    def _run_priv_file_ops(self, ops, timeout=20):
+        """Apply a list of file operations through `_priv_helper.py` in one process.
+
+        The helper is elevated at most once (via `_run_with_possible_privilege`)
+        for the whole batch. Returns `(res, results)` where `results` is the
+        helper's per-operation list (empty if it could not be parsed).
+        """
+        helper = str(_PRIV_HELPER_PATH)
+        py = sys.executable or shutil.which('python3') or 'python3'
+        res = self._run_with_possible_privilege([py, helper], timeout=timeout, input=json.dumps(ops))
+        results = []
+        try:
+            results = json.loads((getattr(res, 'stdout', '') or '').strip() or '[]')
+        except Exception:
+            logger.debug('Could not parse privileged helper output: %r', getattr(res, 'stdout', ''))
+        return res, results
+
     def enter_external_admin(self):
         """Enter External Admin mode (no password required)."""
         try:
@@ -1427,18 +2294,11 @@ class ConsciousnessLab:
             if mode == 'self':
                 try:
                     # Disable action buttons
-                    for btn in (getattr(self, 'baseline_btn', None), getattr(self, 'experiment_btn', None),
-                                getattr(self, 'mark_btn', None), getattr(self, 'group_btn', None),
-                                getattr(self, 'export_btn', None), getattr(self, 'toggle_bt_btn', None),
-                                getattr(self, 'seed_btn', None), getattr(self, 'scan_btn', None)):
-                        if btn is not None:
-                            try:
-                                btn.state(['disabled'])
-                            except Exception:
-                                try:
-                                    btn.config(state='disabled')
-                                except Exception:
-                                    pass
+                    for set_enabled in self._admin_toggle_btns:
+                        try:
+                            set_enabled(False)
+                        except Exception:
+                            pass
                     # For Self-Admin, disable controls but keep layout stable and visible
                     # This avoids layout shifts on small screens and keeps status context
                     try:
@@ -1452,20 +2312,13 @@ class ConsciousnessLab:
             else:
                 # External admin — restore UI and enable buttons
                 try:
-                    for btn in (getattr(self, 'baseline_btn', None), getattr(self, 'experiment_btn', None),
-                                getattr(self, 'mark_btn', None), getattr(self, 'group_btn', None),
-                                getattr(self, 'export_btn', None), getattr(self, 'toggle_bt_btn', None),
-                                getattr(self, 'seed_btn', None), getattr(self, 'scan_btn', None)):
-                        if btn is not None:
-                            try:
-                                btn.state(['!disabled'])
-                            except Exception:
-                                try:
-                                    btn.config(state='normal')
-                                except Exception:
-                                    pass
-
-                    # Restore stats labels
+                    for set_enabled in self._admin_toggle_btns:
+                        try:
+                            set_enabled(True)
+                        except Exception:
+                            pass
+
+                    # Restore stats labels
                     try:
                         # If they were removed, re-pack/place
                         self.stats_label.pack(pady=5)
@@ -1524,20 +2377,26 @@ class ConsciousnessLab:
 
         event_type: short string
         details: mapping
+
+        Inside `_audit_coalesce()` the event is queued as a step of the
+        enclosing record instead of being written immediately.
         """
         try:
-            root = pathlib.Path(__file__).resolve().parent
-            logp = root / 'audit.log'
-            ts = datetime.utcnow().isoformat() + 'Z'
+            # Naive UTC datetime; serialized to ISO 8601 with 'Z' by `_dumps_line`
+            ts = datetime.utcnow()
+            if self._audit_pending is not None:
+                self._audit_pending.append({'timestamp': ts, 'event': event_type, 'details': details})
+                return
+            logp = _AUDIT_LOG_PATH
             who = details.get('user') or getpass.getuser()
             entry = {'timestamp': ts, 'event': event_type, 'user': who, 'details': details}
 
             # Ensure the audit log exists and has restrictive permissions (owner read/write only).
             # Write the entry, then attempt to chmod to 0o600 to limit access.
             try:
-                # Open with append mode; create if needed
-                with open(logp, 'a') as f:
-                    f.write(json.dumps(entry) + "\n")
+                # Open with binary append mode; create if needed
+                with open(logp, 'ab') as f:
+                    f.write(_dumps_line(entry))
                 try:
                     # Set restrictive permissions; ignore if not permitted
                     os.chmod(logp, 0o600)
@@ -1549,24 +2408,39 @@ class ConsciousnessLab:
         except Exception:
             pass
 
+    @contextlib.contextmanager
+    def _audit_coalesce(self, event_type: str, details: dict = None):
+        """Collect audit events raised inside the block into a single record.
+
+        On exit one `event_type` entry is written whose details carry the
+        queued events under 'steps'.
+        """
+        self._audit_pending = []
+        try:
+            yield
+        finally:
+            steps, self._audit_pending = self._audit_pending, None
+            merged = dict(details or {})
+            merged['steps'] = steps
+            self._audit_event(event_type, merged)
+
     def start_test_self_admin(self):
         """One-click flow: switch to Self-Admin, start an experiment session, and audit the action."""
         try:
-            # Switch to self-admin UI
-            self.set_admin_mode('self')
-
-            # Start an experiment session if not running
-            if not self.running:
-                # For individual mode, ensure selected devices are connected as usual
-                # toggle_session will set up times and start RNG collection
-                self.toggle_session('experiment')
-
-            # Audit
             try:
                 who = getpass.getuser()
-                self._audit_event('start-test-self-admin', {'user': who})
             except Exception:
-                pass
+                who = None
+            # Audit the admin switch and session start as one record
+            with self._audit_coalesce('start-test-self-admin', {'user': who}):
+                # Switch to self-admin UI
+                self.set_admin_mode('self')
+
+                # Start an experiment session if not running
+                if not self.running:
+                    # For individual mode, ensure selected devices are connected as usual
+                    # toggle_session will set up times and start RNG collection
+                    self.toggle_session('experiment')
         except Exception as e:
             messagebox.showerror('Error', f'Could not start test: {e}')
 
@@ -1586,36 +2460,68 @@ class ConsciousnessLab:
         except Exception as e:
             messagebox.showerror('Error', f'Could not end test: {e}')
 
-    def show_troubleshooting(self):
-        """Open a small dialog showing polkit and udev guidance for Bluetooth and SDR access."""
+    def _troubleshooting_sections(self):
+        """Return [(path, text)] for the polkit and udev guidance files.
+
+        The files are looked up next to this module (not the working
+        directory). While neither file changes the previously returned list
+        object is returned again, so callers can compare with `is`.
+        """
+        polkit_path = "POLKIT_RULES.md"
+        udev_path = "udev/52-rtl-sdr.rules"
+        sections = []
+
         try:
-            polkit_path = "POLKIT_RULES.md"
-            udev_path = "udev/52-rtl-sdr.rules"
-            sections = []
+            sections.append((polkit_path, _read_cached(str(_MODULE_DIR / polkit_path))))
+        except Exception:
+            sections.append((polkit_path, "(not found) - see repository POLKIT_RULES.md"))
 
-            try:
-                with open(polkit_path, 'r') as f:
-                    sections.append((polkit_path, f.read()))
-            except Exception:
-                sections.append((polkit_path, "(not found) - see repository POLKIT_RULES.md"))
+        try:
+            sections.append((udev_path, _read_cached(str(_MODULE_DIR / udev_path))))
+        except Exception:
+            sections.append((udev_path, "(not found) - see repository udev/52-rtl-sdr.rules"))
+
+        prev = self._trouble_sections
+        # `_read_cached` hands back the same str object until the file's mtime changes
+        if prev is not None and len(prev) == len(sections) and all(
+                a[1] is b[1] or a[1] == b[1] for a, b in zip(prev, sections)):
+            return prev
+        return sections
+
+    def _set_troubleshooting_text(self, sections):
+        """Replace the troubleshooting dialog text with `sections`."""
+        txt = self._trouble_txt
+        self._trouble_sections = sections
+        txt.configure(state=tk.NORMAL)
+        txt.delete('1.0', tk.END)
+        # Build the whole text Python-side and hand it to Tk in one insert
+        txt.insert('1.0', ''.join(f"=== {path} ===\n{content}\n\n" for path, content in sections))
+        txt.configure(state=tk.DISABLED)
 
-            try:
-                with open(udev_path, 'r') as f:
-                    sections.append((udev_path, f.read()))
-            except Exception:
-                sections.append((udev_path, "(not found) - see repository udev/52-rtl-sdr.rules"))
+    def show_troubleshooting(self):
+        """Open a small dialog showing polkit and udev guidance for Bluetooth and SDR access.
+
+        The dialog is built on first use and withdrawn on close; later calls
+        re-show it, refreshing the text only if the source files changed.
+        """
+        try:
+            sections = self._troubleshooting_sections()
+
+            dlg = self._trouble_dlg
+            if dlg is not None and dlg.winfo_exists():
+                if sections is not self._trouble_sections:
+                    self._set_troubleshooting_text(sections)
+                dlg.deiconify()
+                dlg.lift()
+                return
 
             dlg = tk.Toplevel(self.root)
             dlg.title("Troubleshooting & Setup")
             dlg.geometry("700x500")
-            txt = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
-            txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-
-            for path, content in sections:
-                txt.insert(tk.END, f"=== {path} ===\n")
-                txt.insert(tk.END, content + "\n\n")
-
-            txt.configure(state=tk.DISABLED)
+            dlg.protocol("WM_DELETE_WINDOW", dlg.withdraw)
+            self._trouble_txt = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
+            self._set_troubleshooting_text(sections)
+            self._trouble_txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
             btn_frame = tk.Frame(dlg)
             btn_frame.pack(fill=tk.X, pady=(0,8))
@@ -1623,125 +2529,117 @@ class ConsciousnessLab:
             def _copy_all():
                 try:
                     self.root.clipboard_clear()
-                    self.root.clipboard_append('\n'.join([c for _, c in sections]))
+                    self.root.clipboard_append('\n'.join([c for _, c in self._trouble_sections]))
                     messagebox.showinfo("Copied", "Troubleshooting text copied to clipboard")
                 except Exception as e:
                     messagebox.showwarning("Copy failed", str(e))
 
             tk.Button(btn_frame, text="Copy To Clipboard", command=_copy_all).pack(side='left', padx=6)
-            tk.Button(btn_frame, text="Apply Driver Fixes", command=lambda: threading.Thread(target=self.run_driver_fix, daemon=True).start()).pack(side='left', padx=6)
-            tk.Button(btn_frame, text="Run rtl_test (root)", command=lambda: threading.Thread(target=self.run_rtl_test_as_root, daemon=True).start()).pack(side='left', padx=6)
-            tk.Button(btn_frame, text="Undo Driver Fixes", command=lambda: threading.Thread(target=self.revert_driver_fix, daemon=True).start()).pack(side='left', padx=6)
-            tk.Button(btn_frame, text="Close", command=dlg.destroy).pack(side='right', padx=6)
+            tk.Button(btn_frame, text="Apply Driver Fixes", command=self.start_driver_fix).pack(side='left', padx=6)
+            tk.Button(btn_frame, text="Run rtl_test (root)", command=lambda: self._serial_pool.submit(self.run_rtl_test_as_root)).pack(side='left', padx=6)
+            tk.Button(btn_frame, text="Undo Driver Fixes", command=self.start_revert_driver_fix).pack(side='left', padx=6)
+            tk.Button(btn_frame, text="Close", command=dlg.withdraw).pack(side='right', padx=6)
+            self._trouble_dlg = dlg
 
         except Exception as e:
             messagebox.showerror("Error", f"Could not open troubleshooting dialog: {e}")
 
     def show_onboarding(self):
-        """Show onboarding dialog with quick checks for SDR and Bluetooth."""
+        """Show onboarding dialog with quick checks for SDR and Bluetooth.
+
+        Built on first use by `_build_onboarding`; closing withdraws it so
+        reopening is a deiconify.
+        """
         try:
-            dlg = tk.Toplevel(self.root)
-            dlg.title("Welcome to mindfield-core — Onboarding")
-            dlg.geometry("620x360")
+            dlg = self._onboard_dlg
+            if dlg is None or not dlg.winfo_exists():
+                dlg = self._onboard_dlg = self._build_onboarding()
+            dlg.deiconify()
+            dlg.lift()
+        except Exception:
+            logger.exception('Onboarding failed')
 
-            header = tk.Label(dlg, text="Welcome — Quick Setup", font=self.header_font)
-            header.pack(pady=(10,6))
+    def _build_onboarding(self):
+        """Create the onboarding Toplevel and its widgets; returns it."""
+        dlg = tk.Toplevel(self.root)
+        dlg.title("Welcome to mindfield-core — Onboarding")
+        dlg.geometry("620x360")
+        dlg.protocol("WM_DELETE_WINDOW", dlg.withdraw)
 
-            info = tk.Label(dlg, text=("This assistant will check for RTL-SDR availability and Bluetooth access. "
-                                        "You can open Troubleshooting for polkit/udev instructions."), wraplength=580)
-            info.pack(padx=10)
+        header = tk.Label(dlg, text="Welcome — Quick Setup", font=self.header_font)
+        header.pack(pady=(10,6))
 
-            frame = tk.Frame(dlg)
-            frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=8)
+        info = tk.Label(dlg, text=("This assistant will check for RTL-SDR availability and Bluetooth access. "
+                                    "You can open Troubleshooting for polkit/udev instructions."), wraplength=580)
+        info.pack(padx=10)
 
-            self._onboard_sdr_label = tk.Label(frame, text="SDR: unknown", width=30, anchor='w')
-            self._onboard_sdr_label.grid(row=0, column=0, sticky='w', pady=6)
+        frame = tk.Frame(dlg)
+        frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=8)
 
-            self._onboard_bt_label = tk.Label(frame, text="Bluetooth: unknown", width=30, anchor='w')
-            self._onboard_bt_label.grid(row=1, column=0, sticky='w', pady=6)
+        self._onboard_sdr_label = tk.Label(frame, text="SDR: unknown", width=30, anchor='w')
+        self._onboard_sdr_label.grid(row=0, column=0, sticky='w', pady=6)
 
-            btns = tk.Frame(dlg)
-            btns.pack(fill=tk.X, pady=(6,10))
+        self._onboard_bt_label = tk.Label(frame, text="Bluetooth: unknown", width=30, anchor='w')
+        self._onboard_bt_label.grid(row=1, column=0, sticky='w', pady=6)
 
-            def _run_checks():
-                def _worker():
-                    try:
-                        from sdr_rng import is_sdr_available
-                        s = is_sdr_available()
-                    except Exception:
-                        s = False
+        btns = tk.Frame(dlg)
+        btns.pack(fill=tk.X, pady=(6,10))
 
-                    # Use the new verify_connectivity helper for a more complete check
-                    try:
-                        bt_stats = self.verify_connectivity(do_ble_scan=False)
-                    except Exception:
-                        bt_stats = {'bluez': None, 'bluetoothctl': None, 'rfkill': None, 'ble_scan': None, 'ok': False}
-
-                    self._onboard_sdr_label.config(text=f"SDR: {'available' if s else 'not available'}")
-                    # Prefer BlueZ result if present
-                    bt_text = bt_stats.get('bluez') or bt_stats.get('bluetoothctl') or bt_stats.get('rfkill')
-                    if bt_text is True:
-                        bt_text = 'unblocked'
-                    if bt_text is False:
-                        bt_text = 'blocked'
-                    self._onboard_bt_label.config(text=f"Bluetooth: {bt_text if bt_text else 'unknown'}")
-                    # Update BT LED
-                    try:
-                        self._set_led(self.bt_led, 'on' if bt_stats.get('ok') else 'off')
-                    except Exception:
-                        pass
+        tk.Button(btns, text="Run Checks", command=self._run_onboarding_checks).pack(side='left', padx=6)
+        tk.Button(btns, text="Troubleshooting", command=self.show_troubleshooting).pack(side='left', padx=6)
 
-                threading.Thread(target=_worker, daemon=True).start()
+        def _dont_show():
+            try:
+                _mark_onboarding_seen()
+            except OSError:
+                pass
+            dlg.withdraw()
 
-            tk.Button(btns, text="Run Checks", command=_run_checks).pack(side='left', padx=6)
-            tk.Button(btns, text="Troubleshooting", command=self.show_troubleshooting).pack(side='left', padx=6)
+        tk.Button(btns, text="Don't show again", command=_dont_show).pack(side='right', padx=6)
+        tk.Button(btns, text="Close", command=dlg.withdraw).pack(side='right', padx=6)
+        return dlg
 
-            def _dont_show():
-                try:
-                    seen_flag = os.path.join(os.getcwd(), '.mindfield_seen')
-                    with open(seen_flag, 'w') as f:
-                        f.write('seen')
-                except Exception:
-                    pass
-                dlg.destroy()
+    def _run_onboarding_checks(self):
+        """Handler for "Run Checks": probe SDR and Bluetooth and fill the onboarding labels.
 
-            tk.Button(btns, text="Don't show again", command=_dont_show).pack(side='right', padx=6)
-            tk.Button(btns, text="Close", command=dlg.destroy).pack(side='right', padx=6)
+        The two probes are independent: they run as two pool tasks and each label
+        is updated as soon as its own result is in. Recent results are reused so
+        repeated clicks don't re-probe USB/BlueZ.
+        """
+        def _sdr_worker():
+            s = self._sdr_available()
+            self._ui(self._onboard_sdr_label.config, text=f"SDR: {'available' if s else 'not available'}")
 
-        except Exception as e:
-            print(f"Onboarding failed: {e}")
+        def _bt_worker():
+            # Use the new verify_connectivity helper for a more complete check
+            try:
+                bt_stats = self._ttl('conn', self._check_cache_ttl,
+                                     lambda: self.verify_connectivity(do_ble_scan=False))
+            except Exception:
+                bt_stats = {'bluez': None, 'bluetoothctl': None, 'rfkill': None, 'ble_scan': None, 'ok': False}
+
+            # Prefer BlueZ result if present
+            bt_text = bt_stats.get('bluez') or bt_stats.get('bluetoothctl') or bt_stats.get('rfkill')
+            if bt_text is True:
+                bt_text = 'unblocked'
+            if bt_text is False:
+                bt_text = 'blocked'
+            self._ui(self._onboard_bt_label.config, text=f"Bluetooth: {bt_text if bt_text else 'unknown'}")
+            # Update BT LED
+            self._ui(self._set_led, self.bt_led, 'on' if bt_stats.get('ok') else 'off')
+
+        self._bg_pool.submit(_sdr_worker)
+        self._bg_pool.submit(_bt_worker)
 
     def _attach_tooltips(self):
-        """Attach small tooltips to key widgets."""
-        class _ToolTip:
-            def __init__(self, widget, text):
-                self.widget = widget
-                self.text = text
-                self.tip = None
-                widget.bind("<Enter>", self.show)
-                widget.bind("<Leave>", self.hide)
-
-            def show(self, _ev=None):
-                try:
-                    if self.tip:
-                        return
-                    x = self.widget.winfo_rootx() + 20
-                    y = self.widget.winfo_rooty() + self.widget.winfo_height() + 10
-                    self.tip = tk.Toplevel(self.widget)
-                    self.tip.wm_overrideredirect(True)
-                    self.tip.wm_geometry(f"+{x}+{y}")
-                    lbl = tk.Label(self.tip, text=self.text, bg="#222", fg="white", bd=1, padx=6, pady=3)
-                    lbl.pack()
-                except Exception:
-                    pass
+        """Attach small tooltips to key widgets.
 
-            def hide(self, _ev=None):
-                try:
-                    if self.tip:
-                        self.tip.destroy()
-                        self.tip = None
-                except Exception:
-                    pass
+        All tooltips share one borderless Toplevel that is re-texted, moved
+        and shown on hover, then withdrawn on leave. It is only built on the
+        first hover (see `_tooltip_window`).
+        """
+        self._tooltip_tl = None
+        self._tooltip_lbl = None
 
         tips = [
             (self.baseline_btn, "Run a baseline session (no intentions)."),
@@ -1756,11 +2654,16 @@ class ConsciousnessLab:
             (self.scan_btn, "Scan for HRV BLE devices nearby."),
         ]
 
-        for w, t in tips:
-            try:
-                _ToolTip(w, t)
-            except Exception:
-                pass
+        # Keyed by Tk path name so handlers can resolve text from `event.widget`;
+        # every widget shares the same two bound-method handlers. add='+' keeps
+        # any <Enter>/<Leave> bindings the widgets already have
+        self._tooltip_texts = {str(w): t for w, t in tips}
+        try:
+            for w, _t in tips:
+                w.bind("<Enter>", self._tt_show, add='+')
+                w.bind("<Leave>", self._tt_hide, add='+')
+        except Exception:
+            logger.exception('Failed to bind tooltips')
 
         # Ensure action buttons are laid out to fit initial size
         try:
@@ -1768,22 +2671,105 @@ class ConsciousnessLab:
         except Exception:
             pass
 
-        # Reflow when the main inner frame changes size
+        # Reflow when the main inner frame changes size (shares the debounced resize handler)
         try:
-            self.main_inner.bind('<Configure>', lambda e: self._reflow_action_buttons(e))
+            self.main_inner.bind('<Configure>', self._on_root_config)
         except Exception:
             pass
 
-    def run_driver_fix(self):
+    def _tooltip_window(self):
+        """Return the shared tooltip Toplevel, creating it (withdrawn) on first use."""
+        tl = self._tooltip_tl
+        if tl is None:
+            tl = tk.Toplevel(self.root)
+            tl.withdraw()
+            tl.wm_overrideredirect(True)
+            self._tooltip_lbl = tk.Label(tl, text="", bg="#222", fg="white", bd=1, padx=6, pady=3)
+            self._tooltip_lbl.pack()
+            self._tooltip_tl = tl
+        return tl
+
+    def _tt_show(self, ev):
+        """Show the shared tooltip below the hovered widget."""
+        try:
+            w = ev.widget
+            text = self._tooltip_texts.get(str(w))
+            if not text:
+                return
+            tl = self._tooltip_window()
+            x = w.winfo_rootx() + 20
+            y = w.winfo_rooty() + w.winfo_height() + 10
+            self._tooltip_lbl.config(text=text)
+            tl.wm_geometry(f"+{x}+{y}")
+            tl.deiconify()
+            tl.lift()
+        except Exception:
+            pass
+
+    def _tt_hide(self, _ev=None):
+        """Hide the shared tooltip (if it was ever shown)."""
+        if self._tooltip_tl is None:
+            return
+        try:
+            self._tooltip_tl.withdraw()
+        except Exception:
+            pass
+
+    def _prompt_driver_fix_options(self):
+        """Show one modal dialog for the driver fix choices.
+
+        Returns a dict with `install_udev` / `install_blacklist` booleans, or
+        None if cancelled. Must be called on the main thread.
+        """
+        dlg = tk.Toplevel(self.root)
+        dlg.title('Driver Fix')
+        dlg.transient(self.root)
+        dlg.grab_set()
+
+        tk.Label(dlg, text='This will unload kernel modules that may conflict with RTL-SDR and optionally\n'
+                           'install udev and modprobe blacklist files to make the change persistent.',
+                 justify='left').pack(padx=12, pady=(12, 6), anchor='w')
+
+        udev_var = tk.BooleanVar(value=True)
+        bl_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(dlg, variable=udev_var,
+                       text='Create a udev rule granting group "plugdev" device access (/etc/udev/rules.d/52-rtl-sdr.rules)').pack(padx=12, anchor='w')
+        tk.Checkbutton(dlg, variable=bl_var,
+                       text='Blacklist the DVB driver so it does not load automatically (/etc/modprobe.d/blacklist-rtl.conf)').pack(padx=12, anchor='w')
+
+        result = {'val': None}
+
+        def _on_apply():
+            result['val'] = {'install_udev': bool(udev_var.get()), 'install_blacklist': bool(bl_var.get())}
+            dlg.destroy()
+
+        btnf = tk.Frame(dlg)
+        btnf.pack(fill='x', pady=12)
+        tk.Button(btnf, text='Apply', command=_on_apply).pack(side='right', padx=12)
+        tk.Button(btnf, text='Cancel', command=dlg.destroy).pack(side='right')
+
+        self.root.wait_window(dlg)
+        return result['val']
+
+    def start_driver_fix(self):
+        """Ask for the driver fix options on the main thread, then apply them in the background."""
+        options = self._prompt_driver_fix_options()
+        if options:
+            self._serial_pool.submit(self.run_driver_fix, options)
+
+    def run_driver_fix(self, options=None):
         """Unload DVB kernel modules and optionally install udev/blacklist rules.
 
+        `options` is the dict returned by `_prompt_driver_fix_options()`; when
+        omitted the dialog is shown first (main thread only).
         This will request privilege escalation when needed via `_run_with_possible_privilege`.
-        It writes temporary files into the current working directory then moves them into place.
+        The rule files are written in one `_priv_helper.py` run, which backs up
+        existing files and moves the new contents into place with `os.replace`.
         """
         try:
-            ok = messagebox.askyesno('Driver Fix',
-                                     'This will unload kernel modules that may conflict with RTL-SDR and optionally install udev and modprobe blacklist files to make the change persistent.\n\nContinue?')
-            if not ok:
+            if options is None:
+                options = self._prompt_driver_fix_options()
+            if not options:
                 return
 
             # Step 1: unload common conflicting modules
@@ -1796,36 +2782,45 @@ class ConsciousnessLab:
             except Exception:
                 out_text += 'Unload result: (no detailed output)\n'
 
-            # Ask whether to install udev rule
-            install_udev = messagebox.askyesno('Udev rule', 'Create a udev rule to grant device access to group "plugdev" (writes /etc/udev/rules.d/52-rtl-sdr.rules)?')
-            if install_udev:
+            # Collect the file changes and apply them with a single helper run
+            ops = []
+            udev_target = '/etc/udev/rules.d/52-rtl-sdr.rules'
+            bl_target = '/etc/modprobe.d/blacklist-rtl.conf'
+            if options.get('install_udev'):
                 udev_content = ('# RTL-SDR permissions for Realtek RTL2832U (vendor 0bda product 2838)\n'
                                 'ATTRS{idVendor}=="0bda", ATTRS{idProduct}=="2838", MODE="0664", GROUP="plugdev"\n')
-                tmp_path = os.path.join(os.getcwd(), '.tmp_52-rtl-sdr.rules')
-                try:
-                    with open(tmp_path, 'w') as f:
-                        f.write(udev_content)
+                ops.append({'op': 'write', 'path': udev_target, 'content': udev_content, 'mode': 0o644, 'backup': True})
 
-                    # Backup existing file if present
-                    target = '/etc/udev/rules.d/52-rtl-sdr.rules'
-                    try:
-                        stat_res = self._run_with_possible_privilege(['test', '-f', target], timeout=4)
-                        # If test returned 0, file exists -> create backup
-                        if getattr(stat_res, 'returncode', 1) == 0:
-                            bak = target + '.bak'
-                            self._run_with_possible_privilege(['cp', target, bak], timeout=6)
-                            # record backup for potential revert
-                            self._driver_fix_backups = getattr(self, '_driver_fix_backups', {})
-                            self._driver_fix_backups['udev'] = bak
-                    except Exception:
-                        pass
+            if options.get('install_blacklist'):
+                bl_content = ('# Prevent DVB kernel driver from binding to RTL2832U dongles (for rtl-sdr usage)\n'
+                              'blacklist dvb_usb_rtl28xxu\n'
+                              'blacklist rtl2832_sdr\n'
+                              'blacklist r820t\n')
+                ops.append({'op': 'write', 'path': bl_target, 'content': bl_content, 'mode': 0o644, 'backup': True})
 
-                    mv_res = self._run_with_possible_privilege(['mv', tmp_path, target], timeout=8)
-                    out_text += '\nudev move: ' + str(getattr(mv_res, 'returncode', '')) + '\n'
+            udev_written = False
+            if ops:
+                try:
+                    wres, results = self._run_priv_file_ops(ops)
+                    out_text += f'\nfile install return: {getattr(wres, "returncode", "")}\n'
+                    self._driver_fix_backups = getattr(self, '_driver_fix_backups', {})
+                    for r in results:
+                        key = 'udev' if r.get('path') == udev_target else 'blacklist'
+                        if r.get('ok'):
+                            out_text += f"{key} installed: {r.get('path')}\n"
+                            if r.get('backup'):
+                                # record backup for potential revert
+                                self._driver_fix_backups[key] = r['backup']
+                            udev_written = udev_written or key == 'udev'
+                        else:
+                            out_text += f"{key} failed: {r.get('error', '')}\n"
+                    if not results:
+                        out_text += (getattr(wres, 'stderr', '') or '') + '\n'
                 except Exception as e:
-                    out_text += f'Failed to write/move udev rule: {e}\n'
+                    out_text += f'Failed to install udev/blacklist files: {e}\n'
 
-                # reload udev rules
+            # reload udev rules
+            if udev_written and shutil.which('udevadm'):
                 try:
                     reload_res = self._run_with_possible_privilege(['udevadm', 'control', '--reload'], timeout=6)
                     trigger_res = self._run_with_possible_privilege(['udevadm', 'trigger'], timeout=6)
@@ -1833,21 +2828,6 @@ class ConsciousnessLab:
                 except Exception as e:
                     out_text += f'Failed to reload/trigger udev: {e}\n'
 
-            install_blacklist = messagebox.askyesno('Blacklist module', 'Write a modprobe blacklist file to prevent DVB driver loading automatically (writes /etc/modprobe.d/blacklist-rtl.conf)?')
-            if install_blacklist:
-                bl_content = ('# Prevent DVB kernel driver from binding to RTL2832U dongles (for rtl-sdr usage)\n'
-                              'blacklist dvb_usb_rtl28xxu\n'
-                              'blacklist rtl2832_sdr\n'
-                              'blacklist r820t\n')
-                tmpb = os.path.join(os.getcwd(), '.tmp_blacklist-rtl.conf')
-                try:
-                    with open(tmpb, 'w') as f:
-                        f.write(bl_content)
-                    mvb = self._run_with_possible_privilege(['mv', tmpb, '/etc/modprobe.d/blacklist-rtl.conf'], timeout=8)
-                    out_text += '\nblacklist move: ' + str(getattr(mvb, 'returncode', '')) + '\n'
-                except Exception as e:
-                    out_text += f'Failed to write/move blacklist file: {e}\n'
-
             # Summarize and show results
             def _show():
                 try:
@@ -1855,21 +2835,18 @@ class ConsciousnessLab:
                     dlg.title('Driver Fix Results')
                     dlg.geometry('720x420')
                     txt = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
-                    txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-                    txt.insert(tk.END, out_text)
+                    txt.insert('1.0', out_text)
                     txt.configure(state=tk.DISABLED)
+                    txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
                     tk.Button(dlg, text='Close', command=dlg.destroy).pack(pady=6)
                 except Exception:
                     messagebox.showinfo('Driver Fix Results', out_text)
 
-            try:
-                self.root.after(0, _show)
-            except Exception:
-                messagebox.showinfo('Driver Fix Results', out_text)
+            self._ui(_show)
 
         except Exception as e:
             logger.exception('Driver fix failed')
-            messagebox.showerror('Driver Fix', f'Error while applying driver fixes: {e}')
+            self._ui_dialog('showerror', 'Driver Fix', f'Error while applying driver fixes: {e}')
 
     def run_rtl_test_as_root(self):
         """Run `rtl_test -t` with privilege if needed and show the output in a dialog."""
@@ -1889,71 +2866,61 @@ class ConsciousnessLab:
                 dlg.title('rtl_test output')
                 dlg.geometry('720x420')
                 txt = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
-                txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-                txt.insert(tk.END, out)
+                txt.insert('1.0', out)
                 txt.configure(state=tk.DISABLED)
+                txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
                 tk.Button(dlg, text='Close', command=dlg.destroy).pack(pady=6)
             except Exception:
                 messagebox.showinfo('rtl_test', out)
 
-        try:
-            self.root.after(0, _show)
-        except Exception:
-            pass
+        self._ui(_show)
+
+    def start_revert_driver_fix(self):
+        """Confirm on the main thread, then undo the driver fixes in the background."""
+        if messagebox.askyesno('Undo Driver Fixes', 'Attempt to restore previous udev/blacklist files and reload udev? Continue?'):
+            self._serial_pool.submit(self.revert_driver_fix)
 
     def revert_driver_fix(self):
         """Undo driver fix by restoring backups or removing added files.
 
         Uses backups created during `run_driver_fix()` stored in `self._driver_fix_backups`.
+        Runs on a worker thread after `start_revert_driver_fix` has confirmed.
         """
         try:
-            ok = messagebox.askyesno('Undo Driver Fixes', 'Attempt to restore previous udev/blacklist files and reload udev? Continue?')
-            if not ok:
-                return
-
             out_text = ''
             backups = getattr(self, '_driver_fix_backups', {}) or {}
 
-            # Restore udev rule
-            target = '/etc/udev/rules.d/52-rtl-sdr.rules'
-            if 'udev' in backups:
-                bak = backups['udev']
-                try:
-                    mv_res = self._run_with_possible_privilege(['mv', bak, target], timeout=8)
-                    out_text += f'Restored udev from {bak} -> {target}\n'
-                except Exception as e:
-                    out_text += f'Failed to restore udev backup: {e}\n'
-            else:
-                # No backup: remove the file we may have created
-                try:
-                    rm_res = self._run_with_possible_privilege(['rm', '-f', target], timeout=6)
-                    out_text += f'Removed udev rule {target}\n'
-                except Exception as e:
-                    out_text += f'Failed to remove udev rule: {e}\n'
+            # Restore backups (or remove the files we created) in one helper run
+            targets = {'udev': '/etc/udev/rules.d/52-rtl-sdr.rules',
+                       'blacklist': '/etc/modprobe.d/blacklist-rtl.conf'}
+            ops = []
+            for key, target in targets.items():
+                if key in backups:
+                    ops.append({'op': 'restore', 'path': target, 'backup': backups[key]})
+                else:
+                    ops.append({'op': 'remove', 'path': target})
+            try:
+                rres, results = self._run_priv_file_ops(ops)
+                for r in results:
+                    if not r.get('ok'):
+                        out_text += f"Failed to {r.get('op')} {r.get('path')}: {r.get('error', '')}\n"
+                    elif r.get('op') == 'restore':
+                        out_text += f"Restored {r.get('path')} from backup\n"
+                    else:
+                        out_text += f"Removed {r.get('path')}\n"
+                if not results:
+                    out_text += f'Undo return: {getattr(rres, "returncode", "")}\n' + (getattr(rres, 'stderr', '') or '') + '\n'
+            except Exception as e:
+                out_text += f'Failed to restore/remove driver fix files: {e}\n'
 
-            # Restore blacklist
-            target_b = '/etc/modprobe.d/blacklist-rtl.conf'
-            if 'blacklist' in backups:
-                bakb = backups['blacklist']
-                try:
-                    mvb = self._run_with_possible_privilege(['mv', bakb, target_b], timeout=8)
-                    out_text += f'Restored blacklist from {bakb} -> {target_b}\n'
-                except Exception as e:
-                    out_text += f'Failed to restore blacklist backup: {e}\n'
-            else:
+            # Reload udev
+            if shutil.which('udevadm'):
                 try:
-                    self._run_with_possible_privilege(['rm', '-f', target_b], timeout=6)
-                    out_text += f'Removed blacklist file {target_b}\n'
+                    reload_res = self._run_with_possible_privilege(['udevadm', 'control', '--reload'], timeout=6)
+                    trigger_res = self._run_with_possible_privilege(['udevadm', 'trigger'], timeout=6)
+                    out_text += f'udev reload return: {getattr(reload_res, "returncode", "")}, trigger: {getattr(trigger_res, "returncode", "")}\n'
                 except Exception as e:
-                    out_text += f'Failed to remove blacklist file: {e}\n'
-
-            # Reload udev
-            try:
-                reload_res = self._run_with_possible_privilege(['udevadm', 'control', '--reload'], timeout=6)
-                trigger_res = self._run_with_possible_privilege(['udevadm', 'trigger'], timeout=6)
-                out_text += f'udev reload return: {getattr(reload_res, "returncode", "")}, trigger: {getattr(trigger_res, "returncode", "")}\n'
-            except Exception as e:
-                out_text += f'Failed to reload/trigger udev: {e}\n'
+                    out_text += f'Failed to reload/trigger udev: {e}\n'
 
             # Show results
             def _show():
@@ -1962,50 +2929,53 @@ class ConsciousnessLab:
                     dlg.title('Undo Driver Fix Results')
                     dlg.geometry('720x420')
                     txt = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
-                    txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-                    txt.insert(tk.END, out_text)
+                    txt.insert('1.0', out_text)
                     txt.configure(state=tk.DISABLED)
+                    txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
                     tk.Button(dlg, text='Close', command=dlg.destroy).pack(pady=6)
                 except Exception:
                     messagebox.showinfo('Undo Driver Fix Results', out_text)
 
-            try:
-                self.root.after(0, _show)
-            except Exception:
-                messagebox.showinfo('Undo Driver Fix Results', out_text)
+            self._ui(_show)
 
         except Exception as e:
             logger.exception('Revert driver fix failed')
-            messagebox.showerror('Undo Driver Fixes', f'Error while reverting driver fixes: {e}')
+            self._ui_dialog('showerror', 'Undo Driver Fixes', f'Error while reverting driver fixes: {e}')
 
     def _on_root_config(self, event=None):
         """Debounced handler for root '<Configure>' events to update UI scaling."""
         try:
-            if getattr(self, '_resize_after_id', None):
+            if self._resize_after_id:
                 try:
                     self.root.after_cancel(self._resize_after_id)
                 except Exception:
                     pass
-            self._resize_after_id = self.root.after(120, lambda: self._apply_ui_scale())
+            self._resize_after_id = self.root.after(150, self._apply_ui_scale)
         except Exception:
             pass
 
     def _apply_ui_scale(self):
         """Adjust named font sizes based on current window width for responsive scaling."""
         try:
+            self._resize_after_id = None
             w = max(400, self.root.winfo_width() or 800)
             # scale factor around 1000px baseline
             scale = max(0.7, min(1.6, w / 1000.0))
-            # Apply sizes to named fonts
+            sizes = {'title': max(10, int(18 * scale)), 'header': max(8, int(12 * scale)),
+                     'stats': max(9, int(14 * scale)), 'small': max(8, int(11 * scale))}
+            # Apply sizes to named fonts, reconfiguring only those whose quantized size
+            # changed: Font.configure forces a metric recompute for every widget using it
+            applied = self._applied_font_sizes
+            fonts = {'title': self.title_font, 'header': self.header_font,
+                     'stats': self.stats_font, 'small': self.small_font}
             try:
-                if isinstance(self.title_font, tkfont.Font):
-                    self.title_font.configure(size=max(10, int(18 * scale)))
-                if isinstance(self.header_font, tkfont.Font):
-                    self.header_font.configure(size=max(8, int(12 * scale)))
-                if isinstance(self.stats_font, tkfont.Font):
-                    self.stats_font.configure(size=max(9, int(14 * scale)))
-                if isinstance(self.small_font, tkfont.Font):
-                    self.small_font.configure(size=max(8, int(11 * scale)))
+                for name, size in sizes.items():
+                    if applied.get(name) == size:
+                        continue
+                    font = fonts[name]
+                    if isinstance(font, tkfont.Font):
+                        font.configure(size=size)
+                    applied[name] = size
             except Exception:
                 pass
             # Reflow action buttons to account for width changes
@@ -2023,9 +2993,15 @@ class ConsciousnessLab:
         wrapping when the window is narrow.
         """
         try:
-            frame = getattr(self, 'action_frame', None)
+            frame = self.action_frame
             if frame is None:
                 return
+            # Only re-layout once the width has moved by a meaningful amount
+            w = frame.winfo_width()
+            last = self._last_reflow_width
+            if last is not None and abs(w - last) < 40:
+                return
+            self._last_reflow_width = w
             for child in frame.winfo_children():
                 try:
                     child.grid_forget()
@@ -2038,51 +3014,240 @@ class ConsciousnessLab:
         except Exception:
             pass
 
-    def _get_bluetooth_state(self):
-        """Return 'blocked' or 'unblocked' or None on error.
+    def _init_bt_dbus(self):
+        """Open one system bus connection and start tracking adapter `Powered` values.
 
-        Tries multiple methods (rfkill then bluetoothctl) to determine state.
+        If `dbus.mainloop.glib` and GLib are importable, a GLib main loop runs in
+        a daemon thread and `PropertiesChanged` / `InterfacesAdded` /
+        `InterfacesRemoved` signals keep `self._bt_powered` up to date, so state
+        queries become dictionary lookups. Without GLib the bus is still reused
+        but adapters are re-read on each query.
         """
+        if dbus is None:
+            return
+        GLib = None
         try:
-            # Prefer BlueZ DBus if available — more reliable than `rfkill`/`bluetoothctl` parsing
-            if dbus is not None:
+            from dbus.mainloop.glib import DBusGMainLoop
+            from gi.repository import GLib
+            DBusGMainLoop(set_as_default=True)
+        except Exception:
+            GLib = None
+        try:
+            self._bus = dbus.SystemBus()
+            self._bt_refresh_adapters()
+        except Exception:
+            logger.exception('Could not connect to BlueZ on the system bus')
+            self._bus = None
+            return
+        if GLib is None:
+            return
+        try:
+            self._bus.add_signal_receiver(self._on_bt_props,
+                                          dbus_interface='org.freedesktop.DBus.Properties',
+                                          signal_name='PropertiesChanged',
+                                          arg0='org.bluez.Adapter1',
+                                          path_keyword='path')
+            self._bus.add_signal_receiver(self._on_bt_interfaces_changed,
+                                          dbus_interface='org.freedesktop.DBus.ObjectManager',
+                                          signal_name='InterfacesAdded',
+                                          bus_name='org.bluez')
+            self._bus.add_signal_receiver(self._on_bt_interfaces_changed,
+                                          dbus_interface='org.freedesktop.DBus.ObjectManager',
+                                          signal_name='InterfacesRemoved',
+                                          bus_name='org.bluez')
+            self._bt_glib_loop = GLib.MainLoop()
+            threading.Thread(target=self._bt_glib_loop.run, name='bt-dbus', daemon=True).start()
+            self._bt_signals = True
+            # Signals keep the LED current from here on; show the initial state
+            self._ui(self._show_bt_powered)
+        except Exception:
+            logger.exception('Could not subscribe to BlueZ signals; adapter state will be polled')
+            self._bt_signals = False
+
+    async def _init_bt_aio_dbus(self):
+        """Connect to BlueZ with the async DBus client on `_aio_loop`.
+
+        Reads the adapters once and subscribes to `PropertiesChanged` on each
+        plus `InterfacesAdded`/`InterfacesRemoved`, so `self._bt_powered` stays
+        current without blocking worker threads on BlueZ round-trips.
+        """
+        try:
+            bus = await AioMessageBus(bus_type=AioBusType.SYSTEM).connect()
+            root = bus.get_proxy_object('org.bluez', '/', await bus.introspect('org.bluez', '/'))
+            manager = root.get_interface('org.freedesktop.DBus.ObjectManager')
+            self._bt_aio_bus = bus
+            await self._bt_aio_refresh(manager)
+
+            def _on_changed(*_args):
+                asyncio.ensure_future(self._bt_aio_refresh(manager))
+
+            manager.on_interfaces_added(_on_changed)
+            manager.on_interfaces_removed(_on_changed)
+            self._bt_signals = True
+        except Exception:
+            logger.exception('Could not connect to BlueZ via async DBus')
+
+    async def _bt_aio_refresh(self, manager):
+        """Re-read adapters via `GetManagedObjects`, subscribing to any new ones."""
+        try:
+            objs = await manager.call_get_managed_objects()
+            powered = {}
+            adapters = {}
+            for path, interfaces in objs.items():
+                if 'org.bluez.Adapter1' not in interfaces:
+                    continue
+                value = interfaces['org.bluez.Adapter1'].get('Powered')
+                powered[path] = bool(getattr(value, 'value', value))
+                adapter = self._bt_aio_adapters.get(path)
+                if adapter is None:
+                    intro = await self._bt_aio_bus.introspect('org.bluez', path)
+                    proxy = self._bt_aio_bus.get_proxy_object('org.bluez', path, intro)
+                    proxy.get_interface('org.freedesktop.DBus.Properties').on_properties_changed(
+                        functools.partial(self._on_bt_aio_props, path))
+                    adapter = proxy.get_interface('org.bluez.Adapter1')
+                adapters[path] = adapter
+            self._bt_aio_adapters = adapters
+            self._bt_powered = powered
+            self._ui(self._show_bt_powered)
+        except Exception:
+            logger.exception('Failed to refresh BlueZ adapters (async DBus)')
+
+    def _on_bt_aio_props(self, path, interface, changed, invalidated):
+        """PropertiesChanged handler for one adapter (runs on `_aio_loop`)."""
+        if interface == 'org.bluez.Adapter1' and 'Powered' in changed and path in self._bt_aio_adapters:
+            self._bt_powered[path] = bool(changed['Powered'].value)
+            self._ui(self._show_bt_powered)
+
+    async def _bt_aio_adapter_info(self):
+        """'path: powered=..., alias=...' lines for the known adapters (runs on `_aio_loop`)."""
+        lines = []
+        for path, adapter in list(self._bt_aio_adapters.items()):
+            powered, alias = await asyncio.gather(adapter.get_powered(), adapter.get_alias())
+            lines.append(f"{path}: powered={powered}, alias={alias or path}")
+        return lines
+
+    async def _bt_aio_toggle(self):
+        """Flip `Powered` on the first adapter; returns the new value."""
+        adapter = next(iter(self._bt_aio_adapters.values()))
+        powered = await adapter.get_powered()
+        await adapter.set_powered(not powered)
+        return not powered
+
+    def _show_bt_powered(self):
+        """Reflect the signal-tracked adapter state on the BT LED (Tk thread).
+
+        Posted via `_ui` by the BlueZ signal handlers, so the LED follows
+        external changes (e.g. `bluetoothctl power off`) without polling.
+        """
+        led = getattr(self, 'bt_led', None)
+        if led is None:
+            return
+        values = list(self._bt_powered.values())
+        self._set_led(led, ('on' if any(values) else 'off') if values else 'unknown')
+
+    def _bt_refresh_adapters(self):
+        """Re-read all BlueZ adapters and their `Powered` values via `GetManagedObjects`."""
+        manager = dbus.Interface(self._bus.get_object('org.bluez', '/'),
+                                 'org.freedesktop.DBus.ObjectManager')
+        powered = {}
+        for path, interfaces in manager.GetManagedObjects().items():
+            if 'org.bluez.Adapter1' in interfaces:
+                powered[str(path)] = bool(interfaces['org.bluez.Adapter1'].get('Powered', False))
+        self._bt_powered = powered
+
+    def _on_bt_props(self, interface, changed, invalidated, path=None):
+        """PropertiesChanged handler for `org.bluez.Adapter1` (runs on the GLib thread)."""
+        try:
+            if 'Powered' in changed and path is not None:
+                self._bt_powered[str(path)] = bool(changed['Powered'])
+                self._ui(self._show_bt_powered)
+        except Exception:
+            logger.exception('Failed to handle BlueZ PropertiesChanged')
+
+    def _on_bt_interfaces_changed(self, *args):
+        """Adapter added/removed: rebuild the cached adapter table."""
+        self._bluez_props = None
+        try:
+            self._bt_refresh_adapters()
+            self._ui(self._show_bt_powered)
+        except Exception:
+            logger.exception('Failed to refresh BlueZ adapters')
+
+    def _bluez_adapter_props(self):
+        """Return a cached `org.freedesktop.DBus.Properties` proxy for the first adapter.
+
+        Resolved once and reused across toggles; dropped again when BlueZ
+        reports adapters being added or removed, or when a call on it fails.
+        """
+        if self._bluez_props is not None or self._bus is None:
+            return self._bluez_props
+        if not self._bt_powered:
+            self._bt_refresh_adapters()
+        if not self._bt_powered:
+            return None
+        adapter_path = next(iter(self._bt_powered))
+        self._bluez_props = dbus.Interface(self._bus.get_object('org.bluez', adapter_path),
+                                           'org.freedesktop.DBus.Properties')
+        self._bluez_props_path = adapter_path
+        return self._bluez_props
+
+    def _bt_dbus_state(self):
+        """Return 'unblocked'/'blocked' from the cached BlueZ adapters, or None if unknown."""
+        if self._bus is None and not self._bt_signals:
+            return None
+        try:
+            if not self._bt_signals:
+                # No signals to keep the table current: re-read Powered with one
+                # Get on the cached adapter proxy, enumerating BlueZ objects only
+                # when there is no usable proxy
+                props = self._bluez_adapter_props()
                 try:
-                    try:
-                        system_bus = dbus.SystemBus()
-                    except Exception:
-                        system_bus = None
-                    if system_bus is not None:
-                        manager = dbus.Interface(
-                            system_bus.get_object('org.bluez', '/'),
-                            'org.freedesktop.DBus.ObjectManager'
-                        )
-                        objs = manager.GetManagedObjects()
-                        for path, interfaces in objs.items():
-                            if 'org.bluez.Adapter1' in interfaces:
-                                props = interfaces['org.bluez.Adapter1']
-                                # `Powered` property may be a boolean-like
-                                powered = props.get('Powered')
-                                if powered is True or str(powered).lower() == 'true':
-                                    return 'unblocked'
-                                if powered is False or str(powered).lower() == 'false':
-                                    return 'blocked'
+                    if props is None:
+                        raise LookupError('no adapter proxy')
+                    self._bt_powered[self._bluez_props_path] = bool(props.Get('org.bluez.Adapter1', 'Powered'))
                 except Exception:
-                    logger.exception('DBus check for Bluetooth state failed')
+                    self._bluez_props = None
+                    self._bt_refresh_adapters()
+            values = list(self._bt_powered.values())
+        except Exception:
+            logger.exception('DBus check for Bluetooth state failed')
+            return None
+        if not values:
+            return None
+        return 'unblocked' if any(values) else 'blocked'
+
+    def _get_bluetooth_state(self):
+        """Return 'blocked' or 'unblocked' or None on error (reused for up to 1 s)."""
+        return self._ttl('bt', 1.0, self._read_bluetooth_state)
+
+    def _read_bluetooth_state(self):
+        """Probe the Bluetooth state for `_get_bluetooth_state`.
+
+        Uses the cached BlueZ adapter state when available, otherwise tries
+        rfkill then bluetoothctl.
+        """
+        try:
+            # Prefer BlueZ DBus if available — more reliable than `rfkill`/`bluetoothctl` parsing
+            state = self._bt_dbus_state()
+            if state is not None:
+                return state
 
-            # Try rfkill first (common on many distros)
+            # Kernel rfkill switches via sysfs: plain file reads, no fork
+            state = _sysfs_rfkill_state()
+            if state is not None:
+                return state
+
+            # Then the rfkill tool (common on many distros)
             try:
                 try:
-                    res = subprocess.run(["rfkill", "list", "bluetooth"], capture_output=True, text=True, timeout=5)
+                    res = _run_killable(["rfkill", "list", "bluetooth"], timeout=5, text=False)
                 except subprocess.TimeoutExpired:
                     logger.warning('rfkill list bluetooth timed out')
                     res = None
                 if res:
-                    out = (res.stdout or "") + (res.stderr or "")
-                    out = out.lower()
-                    if "soft blocked: yes" in out or "blocked: yes" in out:
-                        return "blocked"
-                    if "soft blocked: no" in out or "blocked: no" in out:
-                        return "unblocked"
+                    state = _parse_rfkill(res.stdout, res.stderr)
+                    if state is not None:
+                        return state
             except FileNotFoundError:
                 # rfkill not available; fall through
                 pass
@@ -2090,17 +3255,14 @@ class ConsciousnessLab:
             # Fall back to bluetoothctl show (looks for Powered: yes/no)
             try:
                 try:
-                    res = subprocess.run(["bluetoothctl", "show"], capture_output=True, text=True, timeout=5)
+                    res = _run_killable(_BTCTL + ["show"], timeout=5, text=False)
                 except subprocess.TimeoutExpired:
                     logger.warning('bluetoothctl show timed out')
                     res = None
                 if res:
-                    out = (res.stdout or "") + (res.stderr or "")
-                    out = out.lower()
-                    if "powered: yes" in out:
-                        return "unblocked"
-                    if "powered: no" in out:
-                        return "blocked"
+                    powered = _parse_bt_powered(res.stdout, res.stderr)
+                    if powered is not None:
+                        return "unblocked" if powered else "blocked"
             except FileNotFoundError:
                 pass
 
@@ -2120,90 +3282,75 @@ class ConsciousnessLab:
         """
         results = {'bluez': None, 'bluetoothctl': None, 'rfkill': None, 'ble_scan': None, 'ok': False}
 
-        # Check BlueZ via DBus
-        if dbus is not None:
+        # Check BlueZ via the cached DBus adapter state
+        results['bluez'] = self._bt_dbus_state()
+        if results['bluez'] == 'unblocked':
+            results['ok'] = True
+
+        # rfkill state straight from sysfs when readable; otherwise start the
+        # rfkill tool alongside bluetoothctl so the wall time is the slower of
+        # the two rather than their sum
+        results['rfkill'] = _sysfs_rfkill_state()
+        if results['rfkill'] == 'unblocked':
+            results['ok'] = True
+        checks = [('bluetoothctl', _BTCTL + ["show"])]
+        if results['rfkill'] is None:
+            checks.insert(0, ('rfkill', ["rfkill", "list", "bluetooth"]))
+        procs = {}
+        for key, cmd in checks:
+            try:
+                procs[key] = _spawn_probe(cmd)
+            except FileNotFoundError:
+                results[key] = None
+            except Exception:
+                logger.exception('verify_connectivity: could not start %s', cmd[0])
+
+        deadline = time.monotonic() + 4
+        outputs = {}
+        for key, proc in procs.items():
             try:
+                outputs[key] = proc.communicate(timeout=max(0.1, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                logger.warning('verify_connectivity: %s timed out', key)
+                proc.kill()
                 try:
-                    system_bus = dbus.SystemBus()
+                    proc.wait(1)
                 except Exception:
-                    system_bus = None
-                if system_bus is not None:
-                    manager = dbus.Interface(
-                        system_bus.get_object('org.bluez', '/'),
-                        'org.freedesktop.DBus.ObjectManager'
-                    )
-                    objs = manager.GetManagedObjects()
-                    for path, interfaces in objs.items():
-                        if 'org.bluez.Adapter1' in interfaces:
-                            props = interfaces['org.bluez.Adapter1']
-                            powered = props.get('Powered')
-                            if powered is True or str(powered).lower() == 'true':
-                                results['bluez'] = 'unblocked'
-                                results['ok'] = True
-                                break
-                            if powered is False or str(powered).lower() == 'false':
-                                results['bluez'] = 'blocked'
+                    pass
+                if key == 'bluetoothctl':
+                    results['bluetoothctl'] = 'timed out'
             except Exception:
-                logger.exception('verify_connectivity: BlueZ dbus check failed')
+                logger.exception('verify_connectivity: %s check failed', key)
 
         # rfkill
-        try:
-            res = subprocess.run(["rfkill", "list", "bluetooth"], capture_output=True, text=True, timeout=4)
-            out = (res.stdout or "") + (res.stderr or "")
-            low = out.lower()
-            if "soft blocked: yes" in low or "blocked: yes" in low:
-                results['rfkill'] = 'blocked'
-            elif "soft blocked: no" in low or "blocked: no" in low:
-                results['rfkill'] = 'unblocked'
+        if 'rfkill' in outputs:
+            results['rfkill'] = _parse_rfkill(*outputs['rfkill'])
+            if results['rfkill'] == 'unblocked':
                 results['ok'] = True
-            else:
-                results['rfkill'] = None
-        except subprocess.TimeoutExpired:
-            logger.warning('verify_connectivity: rfkill timed out')
-        except FileNotFoundError:
-            results['rfkill'] = None
-        except Exception:
-            logger.exception('verify_connectivity: rfkill check failed')
 
         # bluetoothctl
-        try:
-            res = subprocess.run(["bluetoothctl", "show"], capture_output=True, text=True, timeout=4)
-            out = (res.stdout or "") + (res.stderr or "")
-            low = out.lower()
-            if "powered: yes" in low:
+        if 'bluetoothctl' in outputs:
+            powered = _parse_bt_powered(*outputs['bluetoothctl'])
+            if powered is True:
                 results['bluetoothctl'] = 'unblocked'
                 results['ok'] = True
-            elif "powered: no" in low:
+            elif powered is False:
                 results['bluetoothctl'] = 'blocked'
             else:
-                results['bluetoothctl'] = out.strip()
-        except subprocess.TimeoutExpired:
-            logger.warning('verify_connectivity: bluetoothctl timed out')
-            results['bluetoothctl'] = 'timed out'
-        except FileNotFoundError:
-            results['bluetoothctl'] = None
-        except Exception:
-            logger.exception('verify_connectivity: bluetoothctl check failed')
+                # Unrecognised output: report it decoded for the diagnostics view
+                out, err = outputs['bluetoothctl']
+                results['bluetoothctl'] = ((out or b'') + (err or b'')).decode('utf-8', 'replace').strip()
 
         # Optional BLE scan using bleak to check radio is scanning/seeing adverts
         if do_ble_scan:
             try:
-                try:
-                    from bleak import BleakScanner
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    devices = loop.run_until_complete(BleakScanner.discover(timeout=ble_timeout))
-                    results['ble_scan'] = len(devices) if devices is not None else 0
-                    if results['ble_scan']:
-                        results['ok'] = True
-                except Exception:
-                    logger.exception('verify_connectivity: BLE scan failed')
-                    results['ble_scan'] = None
-            finally:
-                try:
-                    asyncio.set_event_loop(None)
-                except Exception:
-                    pass
+                devices = self._run_async(self._ble_discover(ble_timeout), timeout=ble_timeout + 2)
+                results['ble_scan'] = len(devices) if devices is not None else 0
+                if results['ble_scan']:
+                    results['ok'] = True
+            except Exception:
+                logger.exception('verify_connectivity: BLE scan failed')
+                results['ble_scan'] = None
 
         return results
 
@@ -2215,66 +3362,52 @@ class ConsciousnessLab:
         (missing lib or permission), falls back to calling `rfkill`.
         """
         def worker():
-            # Update UI immediately on main thread to give feedback
-            try:
-                self.root.after(0, lambda: self.status_bar.config(text="Toggling Bluetooth..."))
-            except Exception:
-                pass
+            # Give feedback right away (applied on the Tk thread)
+            self._ui(self.status_bar.config, text="Toggling Bluetooth...")
 
-            # Do not call tkinter APIs from this thread — collect results and apply them via root.after
+            # Do not call tkinter APIs from this thread — collect results and apply them via `_ui`
             result = {'ok': False, 'method': None, 'action': None, 'message': None}
 
-            print("toggle_bluetooth: worker started")
             logger.debug('toggle_bluetooth: worker started')
-            # Try BlueZ via dbus-python first
+            # Try BlueZ via the async DBus client first
+            if self._bt_aio_adapters:
+                try:
+                    now_on = self._run_async(self._bt_aio_toggle(), timeout=5)
+                    new_state = 'on' if now_on else 'off'
+                    result.update({'ok': True, 'method': 'bluez-dbus', 'action': new_state,
+                                   'message': f'Bluetooth {new_state} (via BlueZ)'})
+                    self._ui(self._apply_bt_toggle, result['message'], new_state == 'on')
+                    logger.info('Bluetooth toggled via BlueZ async DBus: %s', new_state)
+                    return
+                except Exception:
+                    logger.exception('Async DBus toggle failed')
+
+            # Then BlueZ via dbus-python
             if dbus is not None:
                 try:
-                    system_bus = None
-                    try:
-                        system_bus = dbus.SystemBus()
-                    except Exception:
-                        system_bus = None
+                    props = self._bluez_adapter_props()
+                    if props is not None:
+                        try:
+                            powered = bool(props.Get('org.bluez.Adapter1', 'Powered'))
+                        except Exception:
+                            # Stale proxy (adapter gone or BlueZ restarted); resolve again next time
+                            self._bluez_props = None
+                            powered = None
 
-                    if system_bus is not None:
-                        manager = dbus.Interface(
-                            system_bus.get_object('org.bluez', '/'),
-                            'org.freedesktop.DBus.ObjectManager'
-                        )
-                        objs = manager.GetManagedObjects()
-                        adapter_path = None
-                        for path, interfaces in objs.items():
-                            if 'org.bluez.Adapter1' in interfaces:
-                                adapter_path = path
-                                break
-
-                        if adapter_path:
-                            props = dbus.Interface(
-                                system_bus.get_object('org.bluez', adapter_path),
-                                'org.freedesktop.DBus.Properties'
-                            )
+                        # If we could read powered state, toggle it
+                        if powered is not None:
                             try:
-                                powered = bool(props.Get('org.bluez.Adapter1', 'Powered'))
+                                props.Set('org.bluez.Adapter1', 'Powered', dbus.Boolean(not powered))
+                                new_state = 'on' if not powered else 'off'
+                                result.update({'ok': True, 'method': 'bluez-dbus', 'action': new_state,
+                                               'message': f'Bluetooth {new_state} (via BlueZ)'} )
+                                # apply LED and message in main thread
+                                self._ui(self._apply_bt_toggle, result['message'], new_state == 'on')
+                                logger.info('Bluetooth toggled via BlueZ DBus: %s', new_state)
+                                return
                             except Exception:
-                                powered = None
-
-                            # If we could read powered state, toggle it
-                            if powered is not None:
-                                try:
-                                    props.Set('org.bluez.Adapter1', 'Powered', dbus.Boolean(not powered))
-                                    new_state = 'on' if not powered else 'off'
-                                    result.update({'ok': True, 'method': 'bluez-dbus', 'action': new_state,
-                                                   'message': f'Bluetooth {new_state} (via BlueZ)'} )
-                                    # apply LED and message in main thread
-                                    self.root.after(0, lambda: [
-                                        self.status_bar.config(text=result['message']),
-                                        self._set_led(self.bt_led, 'on' if new_state == 'on' else 'off'),
-                                        messagebox.showinfo('Bluetooth', result['message'])
-                                    ])
-                                    logger.info('Bluetooth toggled via BlueZ DBus: %s', new_state)
-                                    return
-                                except Exception as e:
-                                    # proceed to other methods
-                                    logger.exception('DBus set failed')
+                                # proceed to other methods
+                                logger.exception('DBus set failed')
                 except Exception as e:
                     logger.exception('DBus toggle failed')
 
@@ -2284,18 +3417,13 @@ class ConsciousnessLab:
                 powered = None
                 try:
                     try:
-                        res = subprocess.run(["bluetoothctl", "show"], capture_output=True, text=True, timeout=5)
+                        res = _run_killable(_BTCTL + ["show"], timeout=5, text=False)
                     except subprocess.TimeoutExpired:
                         logger.warning('bluetoothctl show timed out (toggle)')
                         res = None
                     if res:
-                        out = (res.stdout or "") + (res.stderr or "")
-                        out_l = out.lower()
-                        logger.debug('bluetoothctl show output: %s', out)
-                        if "powered: yes" in out_l:
-                            powered = True
-                        elif "powered: no" in out_l:
-                            powered = False
+                        logger.debug('bluetoothctl show output: %r', res.stdout)
+                        powered = _parse_bt_powered(res.stdout, res.stderr)
                 except Exception:
                     powered = None
 
@@ -2307,16 +3435,12 @@ class ConsciousnessLab:
                     target = 'off' if powered else 'on'
 
                 logger.debug('Attempting bluetoothctl power %s', target)
-                res = self._run_with_possible_privilege(["bluetoothctl", "power", target], timeout=8)
+                res = self._run_with_possible_privilege(_BTCTL + ["power", target], timeout=5)
                 logger.debug('bluetoothctl power result: %s', res)
                 if res is not None and getattr(res, 'returncode', 1) == 0:
                     result.update({'ok': True, 'method': 'bluetoothctl', 'action': target,
                                    'message': f'Bluetooth {target} (via bluetoothctl)'} )
-                    self.root.after(0, lambda: [
-                        self.status_bar.config(text=result['message']),
-                        self._set_led(self.bt_led, 'on' if target == 'on' else 'off'),
-                        messagebox.showinfo('Bluetooth', result['message'])
-                    ])
+                    self._ui(self._apply_bt_toggle, result['message'], target == 'on')
                     logger.info('Bluetooth toggled via bluetoothctl: %s', target)
                     return
                 else:
@@ -2326,8 +3450,8 @@ class ConsciousnessLab:
                         logger.debug('bluetoothctl returned %s: %s %s', getattr(res,'returncode',None), getattr(res,'stdout',''), getattr(res,'stderr',''))
             except FileNotFoundError:
                 pass
-            except Exception as e:
-                print(f"bluetoothctl toggle failed: {e}")
+            except Exception:
+                logger.exception('bluetoothctl toggle failed')
 
             # Fall back to rfkill
             try:
@@ -2342,17 +3466,21 @@ class ConsciousnessLab:
                     cmd = ["rfkill", "unblock", "bluetooth"]
                     action = "unblocked"
 
+                # Writable sysfs switches (e.g. running as root) avoid the rfkill tool
+                if _sysfs_rfkill_set(action == "blocked"):
+                    result.update({'ok': True, 'method': 'rfkill', 'action': action,
+                                   'message': f'Bluetooth {action} (via rfkill)'})
+                    self._ui(self._apply_bt_toggle, result['message'], action == 'unblocked')
+                    logger.info('Bluetooth toggled via sysfs rfkill: %s', action)
+                    return
+
                 logger.debug('Attempting rfkill command: %s', cmd)
                 res = self._run_with_possible_privilege(cmd, timeout=5)
                 logger.debug('rfkill result: %s', res)
                 if res is not None and getattr(res, 'returncode', 1) == 0:
                     result.update({'ok': True, 'method': 'rfkill', 'action': action,
                                    'message': f'Bluetooth {action} (via rfkill)'} )
-                    self.root.after(0, lambda: [
-                        self.status_bar.config(text=result['message']),
-                        self._set_led(self.bt_led, 'on' if action == 'unblocked' else 'off'),
-                        messagebox.showinfo('Bluetooth', result['message'])
-                    ])
+                    self._ui(self._apply_bt_toggle, result['message'], action == 'unblocked')
                     logger.info('Bluetooth toggled via rfkill: %s', action)
                     return
                 else:
@@ -2373,16 +3501,38 @@ class ConsciousnessLab:
                 )
                 logger.warning('Bluetooth toggle failed: %s', result.get('message'))
 
-            self.root.after(0, _notify_fail)
+            self._ui(_notify_fail)
 
-            # Start worker
+        def _run():
+            try:
+                worker()
+            finally:
+                # The adapter state has (probably) changed; re-probe next time
+                self._ttl_cache.pop('bt', None)
+                self._ttl_cache.pop('conn', None)
+                self._bt_toggle_inflight = False
+                self._ui(self._set_action_busy, self.toggle_bt_btn, False)
+
+        # Ignore double-clicks and repeated clicks while a toggle is still running
+        if self._click_too_soon('bt') or self._bt_toggle_inflight:
+            return
+        self._bt_toggle_inflight = True
+        self._set_action_busy(self.toggle_bt_btn, True)
         try:
-            threading.Thread(target=worker, daemon=True).start()
+            self._serial_pool.submit(_run)
         except Exception as e:
+            self._bt_toggle_inflight = False
+            self._set_action_busy(self.toggle_bt_btn, False)
             try:
                 messagebox.showerror('Error', f'Could not start Bluetooth toggle thread: {e}')
             except Exception:
-                print(f'Failed to start toggle thread: {e}')
+                logger.exception('Failed to start toggle thread')
+
+    def _apply_bt_toggle(self, message, powered_on):
+        """Show a successful Bluetooth toggle: status bar, LED and an info box (Tk thread)."""
+        self.status_bar.config(text=message)
+        self._set_led(self.bt_led, 'on' if powered_on else 'off')
+        messagebox.showinfo('Bluetooth', message)
 
     def seed_rng_from_sdr(self):
         """Collect entropy via atmospheric/quantum RNG (preferred) and seed the internal RNGCollector's DRBG.
@@ -2390,69 +3540,127 @@ class ConsciousnessLab:
         Runs in background and falls back to SDR or software RNG if needed.
         """
         def worker():
-            self.status_bar.config(text="Seeding RNG from Quantum RNG (online preferred)...")
+            # Tk is only touched through `_ui`; this runs on the background pool
+            self._ui(self.status_bar.config, text="Seeding RNG from Quantum RNG (online preferred)...")
             try:
                 # Detect SDR availability first
-                from sdr_rng import is_sdr_available
-                sdr_ok = is_sdr_available()
-                # Request 64 bytes of entropy (aqrng prefers SDR first)
-                seed = get_random_bytes(64)
+                sdr_ok = self._sdr_available()
+                # Request 64 bytes of entropy (aqrng prefers SDR first); kept in a
+                # bytearray so it can be wiped once the DRBG has absorbed it
+                seed = bytearray(get_random_bytes(64))
             except Exception as e:
                 seed = None
                 sdr_ok = False
-                print(f"SDR seed error: {e}")
+                logger.exception('SDR seed error')
 
             if seed:
                 try:
-                    self.rng_collector.seed_rng(seed)
-                    self.status_bar.config(text="RNG seeded from SDR")
-                    messagebox.showinfo("Seeded", "RNG successfully seeded from SDR entropy.")
-                    # Update SDR status
-                    self.sdr_status_label.config(text=f"SDR: {'available' if sdr_ok else 'used fallback'}")
-                    # Update LEDs
-                    self._set_led(self.rng_led, 'on')
-                    self._set_led(self.sdr_led, 'on' if sdr_ok else 'off')
+                    try:
+                        self.rng_collector.seed_rng(seed)
+                    finally:
+                        _wipe(seed)
+                        del seed
+                    self._last_seed_t = time.monotonic()
+                    self._ui(self.status_bar.config, text="RNG seeded from SDR")
+                    # Update SDR status and LEDs before the (modal) info box
+                    self._ui(self.sdr_status_label.config, text=f"SDR: {'available' if sdr_ok else 'used fallback'}")
+                    self._ui(self._set_led, self.rng_led, 'on')
+                    self._ui(self._set_led, self.sdr_led, 'on' if sdr_ok else 'off')
+                    self._ui_dialog('showinfo', "Seeded", "RNG successfully seeded from SDR entropy.")
                 except Exception as e:
-                    self.status_bar.config(text="Seeding failed")
-                    messagebox.showwarning("Seed failed", f"Could not seed RNG: {e}")
+                    self._ui(self.status_bar.config, text="Seeding failed")
+                    self._ui_dialog('showwarning', "Seed failed", f"Could not seed RNG: {e}")
             else:
                 # Fallback: get software RNG (aqrng already attempted SDR/online)
-                sw = get_random_bytes(64)
+                sw = bytearray(get_random_bytes(64))
                 try:
-                    self.rng_collector.seed_rng(sw)
-                    self.status_bar.config(text="RNG seeded from software fallback")
-                    messagebox.showwarning("Fallback", "SDR not available; seeded RNG from software fallback.")
-                    self.sdr_status_label.config(text="SDR: not available (fallback used)")
-                    self._set_led(self.rng_led, 'on')
-                    self._set_led(self.sdr_led, 'off')
+                    try:
+                        self.rng_collector.seed_rng(sw)
+                    finally:
+                        _wipe(sw)
+                        del sw
+                    self._last_seed_t = time.monotonic()
+                    self._ui(self.status_bar.config, text="RNG seeded from software fallback")
+                    self._ui(self.sdr_status_label.config, text="SDR: not available (fallback used)")
+                    self._ui(self._set_led, self.rng_led, 'on')
+                    self._ui(self._set_led, self.sdr_led, 'off')
+                    self._ui_dialog('showwarning', "Fallback", "SDR not available; seeded RNG from software fallback.")
                 except Exception as e:
-                    self.status_bar.config(text="Seeding error")
-                    messagebox.showerror("Seed error", f"Seeding failed: {e}")
+                    self._ui(self.status_bar.config, text="Seeding error")
+                    self._ui_dialog('showerror', "Seed error", f"Seeding failed: {e}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        def _run():
+            try:
+                worker()
+            finally:
+                self._seed_inflight = False
+                self._ui(self._set_action_busy, self.seed_btn, False)
+
+        # Ignore double-clicks and repeated clicks while seeding is still running
+        if self._click_too_soon('seed') or self._seed_inflight:
+            return
+        # A fresh seed was just absorbed; collecting more entropy now adds little
+        if self._last_seed_t is not None and time.monotonic() - self._last_seed_t < _RESEED_MIN_INTERVAL:
+            self.status_bar.config(text="RNG recently seeded; skipping")
+            return
+        self._seed_inflight = True
+        self._set_action_busy(self.seed_btn, True)
+        self._serial_pool.submit(_run)
 
     def _hrv_consumer(self):
         """Background consumer that reads HRV samples placed on `self.coherence_queue`
         by `HRVDeviceManager` and records them into `rng_collector` for correlation
         analysis (bit-index aligned snapshots).
+
+        A `None` item on the queue stops the consumer.
         """
         try:
             while True:
-                try:
-                    sample = self.coherence_queue.get(timeout=1.0)
-                except Empty:
-                    continue
-                try:
-                    # sample is expected to be a dict from HRVDeviceManager
-                    self.rng_collector.record_hrv_snapshot(sample)
-                    # Update UI stream (must run on main thread)
+                sample = self.coherence_queue.get()
+                if sample is None:
+                    break
+                # Drain whatever else has arrived so a burst is recorded in one call
+                batch = [sample]
+                stop = False
+                while True:
                     try:
-                        if getattr(self, 'hrv_stream_box', None) is not None:
-                            self.root.after(0, lambda s=sample: self._append_hrv_stream(s))
-                    except Exception:
-                        pass
+                        nxt = self.coherence_queue.get_nowait()
+                    except Empty:
+                        break
+                    if nxt is None:
+                        stop = True
+                        break
+                    batch.append(nxt)
+                try:
+                    # Latest real-device coherence for update_loop (errors and the
+                    # synthetic graph test are only shown in the HRV panel)
+                    live = [s for s in batch
+                            if isinstance(s, dict) and 'error' not in s and s.get('device') != _HRV_TEST_DEVICE]
+                    if live:
+                        window = self._recent_coherence
+                        total = self._coherence_sum
+                        for s in live:
+                            if len(window) == window.maxlen:
+                                total -= window[0].get('coherence', 0)
+                            window.append(s)
+                            total += s.get('coherence', 0)
+                        self._coherence_sum = total
+                        self._avg_coherence = total / len(window)
+                        self._coherence_seq += 1
+                        for tap in self._coherence_taps:
+                            tap.put(live)
+                    gone = [s.get('device') for s in batch if isinstance(s, dict) and 'error' in s]
+                    if gone:
+                        self._refresh_device_count(gone)
+                    # samples are expected to be dicts from HRVDeviceManager
+                    self.rng_collector.record_hrv_snapshot_batch(batch)
+                    # Hand the samples to the batched UI flush in `_drain_ui_queue`
+                    if getattr(self, 'hrv_stream_box', None) is not None:
+                        self._hrv_pending.extend(batch)
                 except Exception:
                     logger.exception('Failed to record HRV snapshot')
+                if stop:
+                    break
         except Exception:
             logger.exception('HRV consumer exiting')
 
@@ -2463,6 +3671,7 @@ class ConsciousnessLab:
             if running:
                 # stop
                 self._hrv_test_running = False
+                self._hrv_test_stop.set()
                 try:
                     if getattr(self, 'hrv_graph_test_btn', None) is not None:
                         self.hrv_graph_test_btn.config(text='Graph Test')
@@ -2476,6 +3685,7 @@ class ConsciousnessLab:
 
             # start
             self._hrv_test_running = True
+            self._hrv_test_stop = threading.Event()
             self._hrv_test_thread = threading.Thread(target=self._hrv_graph_test_worker, daemon=True)
             self._hrv_test_thread.start()
             try:
@@ -2492,148 +3702,228 @@ class ConsciousnessLab:
 
     def _hrv_graph_test_worker(self):
         """Worker that emits synthetic coherence values periodically to the coherence queue."""
+        stop = self._hrv_test_stop
         try:
             import random, math
+            period = 0.5
             start = time.time()
-            while getattr(self, '_hrv_test_running', False):
+            next_t = time.monotonic() + period
+            while not stop.is_set():
+                # Fixed-rate schedule: if we fell behind (UI stall), drop the
+                # sample and resync instead of emitting a catch-up burst
+                delay = next_t - time.monotonic()
+                if delay < 0:
+                    next_t = time.monotonic() + period
+                    continue
+                if stop.wait(delay):
+                    break
+                next_t += period
                 t = time.time() - start
                 # slow sinusoidal coherence between 0.1 and 0.9 with small noise
                 coh = 0.5 + 0.4 * math.sin(2 * math.pi * (t / 6.0)) + random.uniform(-0.05, 0.05)
                 coh = max(0.0, min(1.0, coh))
                 sample = {
                     'timestamp': time.time(),
-                    'device': 'graph-test',
+                    'device': _HRV_TEST_DEVICE,
                     'heart_rate': 60 + int(5 * math.sin(t)),
                     'coherence': coh,
                     'rr_intervals': []
                 }
                 try:
-                    self.coherence_queue.put(sample, block=False)
+                    put_dropping_oldest(self.coherence_queue, sample)
                 except Exception:
-                    try:
-                        self.coherence_queue.put(sample)
-                    except Exception:
-                        pass
-                time.sleep(0.5)
+                    pass
         except Exception:
             logger.exception('HRV graph test worker failed')
         finally:
-            try:
+            # Skip the reset if a newer test run has already started
+            if getattr(self, '_hrv_test_stop', None) is stop:
                 self._hrv_test_running = False
                 if getattr(self, 'hrv_graph_test_btn', None) is not None:
-                    try:
-                        self.hrv_graph_test_btn.config(text='Graph Test')
-                    except Exception:
-                        pass
-                try:
-                    self.status_bar.config(text='HRV graph test stopped')
-                except Exception:
-                    pass
-            except Exception:
-                pass
+                    self._ui(self.hrv_graph_test_btn.config, text='Graph Test')
+                self._ui(self.status_bar.config, text='HRV graph test stopped')
 
-    def _append_hrv_stream(self, sample: dict):
-        """Append a formatted HRV sample to the on-screen stream box.
+    def _format_hrv_ts(self, ts):
+        """Format an epoch timestamp as local ISO 8601 with milliseconds.
 
-        This runs on the main/UI thread.
+        The seconds part is cached, so samples within the same wall second
+        only format the millisecond suffix.
         """
+        sec = int(ts)
+        if sec != self._last_ts_sec:
+            self._last_ts_str = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+            self._last_ts_sec = sec
+        return f"{self._last_ts_str}.{int((ts - sec) * 1000):03d}"
+
+    def _flush_hrv(self):
+        """Draw all pending HRV samples in one pass.
+
+        Called from `_drain_ui_queue` every 50 ms while `_hrv_consumer` has
+        queued samples, so a burst costs one text insert, one sparkline redraw
+        and one plot update. This runs on the main/UI thread.
+        """
+        samples = []
         try:
-            box = getattr(self, 'hrv_stream_box', None)
-            if box is None:
-                return
-            # Format a compact single-line summary
-            ts = datetime.fromtimestamp(sample.get('timestamp', time.time())).isoformat()
-            dev = sample.get('device', 'unknown')
-            hr = sample.get('heart_rate', 'n/a')
-            coh = sample.get('coherence', 0.0)
-            bi = sample.get('bit_index', None) or len(self.rng_collector.bits)
-            rr = sample.get('rr_intervals', [])
-            txt = f"{ts} | {dev} | HR={hr} | coh={coh:.3f} | bit_index={bi} | rr_count={len(rr)}\n"
-
-            # Insert and keep read-only
-            box.configure(state=tk.NORMAL)
-            box.insert(tk.END, txt)
-            # Trim to reasonable size (keep ~200 lines)
-            lines = int(box.index('end-1c').split('.')[0])
-            if lines > 250:
-                # delete oldest lines
-                box.delete('1.0', f'{lines-200}.0')
-            box.see(tk.END)
-            box.configure(state=tk.DISABLED)
+            while True:
+                samples.append(self._hrv_pending.popleft())
+        except IndexError:
+            pass
+        if not samples:
+            return
+        try:
+            box = self.hrv_stream_box
+            if box is not None:
+                # Format a compact single-line summary per sample
+                default_bi = len(self.rng_collector.bits)
+                now = time.time()
+                fmt_ts = self._format_hrv_ts
+                # One f-string per line compiles to a single BUILD_STRING; the
+                # lines are joined once below for a single Tk insert
+                lines = [
+                    f"{fmt_ts(sample.get('timestamp') or now)} | {sample.get('device', 'unknown')}"
+                    f" | HR={sample.get('heart_rate', 'n/a')} | coh={float(sample.get('coherence') or 0.0):.3f}"
+                    f" | bit_index={sample.get('bit_index') or default_bi}"
+                    f" | rr_count={len(sample.get('rr_intervals') or ())}\n"
+                    for sample in samples
+                ]
+
+                # Track shown lines in Python so trimming needs no index scan;
+                # only the lines pushed out of the deque are deleted from the head
+                overflow = max(0, len(self._hrv_lines) + len(lines) - self._hrv_lines.maxlen)
+                self._hrv_lines.extend(lines)
+
+                # Insert and keep read-only
+                box.configure(state=tk.NORMAL)
+                box.insert(tk.END, ''.join(lines))
+                if overflow:
+                    box.delete('1.0', f'{overflow + 1}.0')
+                box.see(tk.END)
+                box.configure(state=tk.DISABLED)
         except Exception:
             pass
-        # Update sparkline history and redraw
+        # Update sparkline history and redraw once for the whole batch
         try:
-            coh = float(sample.get('coherence', 0.0) or 0.0)
+            cohs = [float(s.get('coherence', 0.0) or 0.0) for s in samples]
             if self._hrv_sparkline_enabled:
-                self._hrv_coherence_history.append(coh)
+                self._hrv_coherence_history.extend(cohs)
                 try:
-                    if getattr(self, 'hrv_spark_canvas', None) is not None:
-                        self._draw_hrv_sparkline()
+                    if self.hrv_spark_canvas is not None:
+                        self._request_sparkline_draw()
                 except Exception:
                     pass
             try:
-                if getattr(self, 'hrv_spark_label', None) is not None:
-                    self.hrv_spark_label.config(text=f"Coh: {coh:.3f}")
+                if self.hrv_spark_label is not None:
+                    self.hrv_spark_label.config(text=f"Coh: {cohs[-1]:.3f}")
             except Exception:
                 pass
         except Exception:
             pass
-        # If matplotlib figure is present, schedule an update of the embedded plot
+        # If matplotlib figure is present, update the embedded plot
         try:
-            if getattr(self, '_hrv_fig', None) is not None and getattr(self, '_hrv_line', None) is not None:
-                try:
-                    # schedule on main thread
-                    self.root.after(0, self._update_hrv_plot)
-                except Exception:
-                    pass
+            if self._hrv_fig is not None and self._hrv_line is not None:
+                self._request_hrv_plot_draw()
         except Exception:
             pass
 
+    def _request_sparkline_draw(self):
+        """Redraw the sparkline now, or schedule one trailing redraw if the last
+        draw was less than 1/15 s ago. Main thread only."""
+        min_interval = 1.0 / 15
+        elapsed = time.monotonic() - self._last_spark_draw_t
+        if elapsed >= min_interval:
+            self._draw_hrv_sparkline()
+        elif self._spark_after_id is None:
+            delay_ms = max(1, int((min_interval - elapsed) * 1000))
+            self._spark_after_id = self.root.after(delay_ms, self._deferred_sparkline_draw)
+
+    def _deferred_sparkline_draw(self):
+        self._spark_after_id = None
+        self._draw_hrv_sparkline()
+
+    def _request_hrv_plot_draw(self):
+        """Update the Matplotlib plot now, or schedule one trailing update if the
+        last one was less than 50 ms ago (~20 FPS cap). Main thread only."""
+        min_interval = 0.05
+        elapsed = time.monotonic() - self._hrv_last_draw
+        if elapsed >= min_interval:
+            self._update_hrv_plot()
+        elif self._hrv_plot_after_id is None:
+            delay_ms = max(1, int((min_interval - elapsed) * 1000))
+            self._hrv_plot_after_id = self.root.after(delay_ms, self._deferred_hrv_plot_draw)
+
+    def _deferred_hrv_plot_draw(self):
+        self._hrv_plot_after_id = None
+        self._update_hrv_plot()
+
     def _draw_hrv_sparkline(self):
         """Draw the coherence sparkline onto the canvas. Assumes called on main thread."""
+        self._last_spark_draw_t = time.monotonic()
         try:
-            canvas = getattr(self, 'hrv_spark_canvas', None)
+            canvas = self.hrv_spark_canvas
             if canvas is None:
                 return
-            data = list(self._hrv_coherence_history)
+            data = self._hrv_coherence_history.view()
             w = max(100, canvas.winfo_width() or 300)
             h = max(20, canvas.winfo_height() or 60)
-            canvas.delete('all')
-            if not data:
+            _, base_id, line_id, dot_id = self._spark_item_ids(canvas)
+            if data.size == 0:
                 # draw baseline
-                canvas.create_line(0, h/2, w, h/2, fill='#ddd')
+                canvas.coords(base_id, 0, h/2, w, h/2)
+                canvas.itemconfigure(base_id, state='normal')
+                canvas.itemconfigure(line_id, state='hidden')
+                canvas.itemconfigure(dot_id, state='hidden')
                 return
 
-            # scale data 0..1 to canvas height (invert y)
-            mx = max(1.0, max(data))
-            mn = min(0.0, min(data))
-            span = mx - mn if (mx - mn) > 0 else 1.0
             # pad left/right
             left_pad = 4
             right_pad = 4
             usable_w = w - left_pad - right_pad
-            step = usable_w / max(1, (len(data)-1))
-            points = []
-            for i, v in enumerate(data):
-                x = left_pad + i * step
-                # normalize
-                nv = (v - mn) / span
-                y = h - (nv * (h - 6)) - 3
-                points.append((x, y))
-
-            # draw polyline
-            for i in range(len(points)-1):
-                x1,y1 = points[i]
-                x2,y2 = points[i+1]
-                canvas.create_line(x1,y1,x2,y2, fill='#2c3e50', width=2)
-
-            # draw latest point
-            lx,ly = points[-1]
-            canvas.create_oval(lx-3, ly-3, lx+3, ly+3, fill='#e67e22', outline='')
+            # Never plot more points than there are pixel columns; keep the newest sample
+            stride = -(-data.size // max(1, usable_w))
+            if stride > 1:
+                data = data[::-1][::stride][::-1]
+            n = data.size
+            # scale data 0..1 to canvas height (invert y); the range is taken
+            # from the points actually plotted, in one contiguous float32 array
+            data = np.ascontiguousarray(data, dtype=np.float32)
+            mx = max(1.0, float(data.max()))
+            mn = min(0.0, float(data.min()))
+            span = mx - mn if (mx - mn) > 0 else 1.0
+            step = usable_w / max(1, (n-1))
+            # interleaved x0, y0, x1, y1, ... computed in one vectorized pass
+            coords = np.empty(2 * n, dtype=np.float32)
+            coords[0::2] = left_pad + np.arange(n, dtype=np.float32) * step
+            coords[1::2] = h - ((data - mn) / span) * (h - 6) - 3
+            coords = coords.tolist()
+            if n < 2:
+                # a line item needs at least two points
+                coords = coords * 2
+
+            # move the existing items instead of deleting and recreating them;
+            # the flat list goes to Tk as one argument rather than 2n unpacked ones
+            canvas.coords(line_id, coords)
+            lx, ly = coords[-2], coords[-1]
+            canvas.coords(dot_id, lx-3, ly-3, lx+3, ly+3)
+            canvas.itemconfigure(base_id, state='hidden')
+            canvas.itemconfigure(line_id, state='normal')
+            canvas.itemconfigure(dot_id, state='normal')
+        except tk.TclError:
+            # canvas destroyed or items removed; recreate them on the next draw
+            self._spark_items = None
         except Exception:
             pass
 
+    def _spark_item_ids(self, canvas):
+        """Return the cached sparkline canvas items, creating them on first use
+        or when the canvas changed or its items were deleted."""
+        items = self._spark_items
+        if items is None or items[0] is not canvas or not canvas.type(items[2]):
+            base_id = canvas.create_line(0, 0, 0, 0, fill='#ddd')
+            line_id = canvas.create_line(0, 0, 0, 0, fill='#2c3e50', width=2)
+            dot_id = canvas.create_oval(0, 0, 0, 0, fill='#e67e22', outline='')
+            items = self._spark_items = (canvas, base_id, line_id, dot_id)
+        return items
+
     # --- Matplotlib / HRV plot control helpers ---
     def _toggle_hrv_plot_pause(self):
         """Toggle pause/resume for the embedded HRV Matplotlib plot."""
@@ -2652,22 +3942,20 @@ class ConsciousnessLab:
         try:
             n = max(10, int(n))
             cur = getattr(self, '_hrv_coherence_history', None)
-            if cur is None:
-                self._hrv_coherence_history = deque(maxlen=n)
-            else:
-                # preserve existing data
-                data = list(cur)
-                self._hrv_coherence_history = deque(data[-n:], maxlen=n)
+            ring = _RingBuf(n)
+            if cur is not None:
+                # preserve the newest existing data
+                ring.extend(cur.view())
+            self._hrv_coherence_history = ring
+            self._hrv_x = np.arange(n, dtype=np.int32)
             self._hrv_history_len = n
             # update axes if using matplotlib
             if getattr(self, '_hrv_ax', None) is not None:
                 try:
                     self._hrv_ax.set_xlim(0, n)
-                    if getattr(self, '_hrv_canvas', None) is not None:
-                        try:
-                            self._hrv_canvas.draw_idle()
-                        except Exception:
-                            pass
+                    # stale until the redraw re-captures it
+                    self._hrv_bg = None
+                    self._request_hrv_redraw()
                 except Exception:
                     pass
         except Exception:
@@ -2679,19 +3967,17 @@ class ConsciousnessLab:
             if not getattr(self.rng_collector, 'hrv_snapshots', None):
                 messagebox.showinfo('Export HRV', 'No HRV snapshots to export')
                 return
+            if getattr(self, 'admin_mode', 'external') != 'external':
+                # redacted in self-admin mode; checked before the file is created
+                messagebox.showinfo('Export HRV', 'HRV snapshots are redacted in self-admin mode')
+                return
             path = filedialog.asksaveasfilename(defaultextension='.csv', filetypes=[('CSV','*.csv')], initialfile='hrv_snapshots.csv')
             if not path:
                 return
-            with open(path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['timestamp', 'device', 'heart_rate', 'coherence', 'bit_index', 'rr_intervals'])
-                snapshots = list(self.rng_collector.hrv_snapshots)
-                if getattr(self, 'admin_mode', 'external') != 'external':
-                    # redacted in self-admin mode
-                    messagebox.showinfo('Export HRV', 'HRV snapshots are redacted in self-admin mode')
-                    return
-                for s in snapshots:
-                    writer.writerow([s.get('timestamp'), s.get('device'), s.get('heart_rate'), s.get('coherence'), s.get('bit_index'), json.dumps(s.get('rr_intervals'))])
+            lines = _hrv_csv_lines(self.rng_collector.hrv_snapshots)
+            with open(path, 'w', newline='', buffering=1 << 20) as f:
+                csv.writer(f).writerow(_HRV_CSV_HEADER)
+                f.writelines(lines)
             messagebox.showinfo('Export HRV', f'HRV snapshots exported to {path}')
         except Exception as e:
             logger.exception('Export HRV CSV failed')
@@ -2720,113 +4006,125 @@ class ConsciousnessLab:
         except Exception:
             pass
 
+    def _on_hrv_draw_event(self, event=None):
+        """Matplotlib `draw_event`: re-capture the axes background (after resizes or
+        axis changes) and paint the animated HRV line over the fresh draw."""
+        try:
+            self._hrv_bg = self._hrv_canvas.copy_from_bbox(self._hrv_ax.bbox)
+            self._hrv_ax.draw_artist(self._hrv_line)
+        except Exception:
+            self._hrv_bg = None
+
     def _update_hrv_plot(self):
-        """Update the embedded Matplotlib HRV line with data from the history deque."""
+        """Update the embedded Matplotlib HRV line with data from the history ring buffer.
+
+        Normally only the line is redrawn (restore background, draw artist,
+        blit); a full redraw is queued via `_request_hrv_redraw` until a
+        background has been captured.
+        """
+        self._hrv_last_draw = time.monotonic()
         try:
-            if getattr(self, '_hrv_plot_paused', False):
+            if self._hrv_plot_paused:
                 return
-            if getattr(self, '_hrv_ax', None) is None or getattr(self, '_hrv_line', None) is None:
+            # all of these are initialised in __init__; bind once per frame
+            ax = self._hrv_ax
+            line = self._hrv_line
+            canvas = self._hrv_canvas
+            if ax is None or line is None or canvas is None:
                 return
-            data = list(getattr(self, '_hrv_coherence_history', []))
-            if not data:
-                # clear line
+            data = self._hrv_coherence_history.view()
+            # empty data clears the line; the axes limits are static and
+            # only change in `_set_hrv_history`
+            line.set_data(self._hrv_x[:data.size], data)
+
+            bg = self._hrv_bg
+            if bg is not None:
                 try:
-                    self._hrv_line.set_data([], [])
-                    self._hrv_ax.set_xlim(0, self._hrv_history_len)
-                    self._hrv_ax.set_ylim(0, 1)
-                    if getattr(self, '_hrv_canvas', None) is not None:
-                        try:
-                            self._hrv_canvas.draw_idle()
-                        except Exception:
-                            pass
+                    canvas.restore_region(bg)
+                    ax.draw_artist(line)
+                    canvas.blit(ax.bbox)
+                    return
                 except Exception:
-                    pass
-                return
+                    logger.debug('HRV plot blit failed; falling back to full redraw', exc_info=True)
+
+            # Full redraw; `_on_hrv_draw_event` re-captures the background afterwards
+            self._request_hrv_redraw()
+        except Exception:
+            pass
 
-            x = list(range(max(0, len(data) - self._hrv_history_len), max(0, len(data) - self._hrv_history_len) + len(data)))
-            # ensure arrays same length
+    def _request_hrv_redraw(self):
+        """Queue one full redraw of the HRV figure in 50 ms; further requests
+        before it runs are folded into it. Main thread only."""
+        if self._hrv_draw_pending or self._hrv_canvas is None:
+            return
+        self._hrv_draw_pending = True
+        try:
+            self.root.after(50, self._flush_hrv_redraw)
+        except Exception:
+            self._hrv_draw_pending = False
+
+    def _flush_hrv_redraw(self):
+        self._hrv_draw_pending = False
+        try:
+            self._hrv_canvas.draw_idle()
+        except Exception:
             try:
-                self._hrv_line.set_data(range(len(data)), data)
-                self._hrv_ax.set_xlim(0, max(self._hrv_history_len, len(data)))
-                # auto-scale y in [0,1]
-                self._hrv_ax.set_ylim(0, 1)
-                if getattr(self, '_hrv_canvas', None) is not None:
-                    try:
-                        # prefer draw_idle if available, fallback to draw
-                        if hasattr(self._hrv_canvas, 'draw_idle'):
-                            self._hrv_canvas.draw_idle()
-                        else:
-                            try:
-                                self._hrv_canvas.draw()
-                            except Exception:
-                                # final fallback: call figure canvas draw via canvas manager
-                                try:
-                                    self._hrv_fig.canvas.draw()
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
+                self._hrv_fig.canvas.draw()
             except Exception:
                 pass
-        except Exception:
-            pass
 
     def _sdr_provider_factory(self, chunk_bytes=1024, sdr_params=None):
         """Return a callable that yields raw bytes for the SDR stream.
 
         The callable will attempt to use `sdr_rng.SDRRNG` and fall back to
         `aqrng.get_random_bytes` or `secrets.token_bytes` if SDR unavailable.
+        Each call blocks on the dongle; `toggle_sdr_stream` runs it on the
+        producer thread (see `_start_sdr_producer`).
         """
         sdr_params = sdr_params or {}
 
-        def provider():
-            try:
-                from sdr_rng import SDRRNG
-                # instantiate per-call is expensive; instantiate once
-            except Exception:
-                SDRRNG = None
+        # Try a sequence of initialization parameter sets to help older
+        # R820T dongles that sometimes fail to lock at higher sample
+        # rates or with aggressive buffer sizes. Only the first is tried
+        # inline; the more conservative ones are swept in the background.
+        param_sets = []
+        # Merge any user-provided sdr_params into trial sets
+        base = dict(sdr_params or {})
+        # Try preferred/default first
+        param_sets.append({**base})
+        # Lower sample rate and buffer sizes
+        param_sets.append({**base, 'sample_rate': 2.048e6, 'samples_per_hash': 16384})
+        # Try explicit maximum gain
+        param_sets.append({**base, 'sample_rate': 2.048e6, 'samples_per_hash': 8192, 'gain': 49.6})
+        # Try minimal gain
+        param_sets.append({**base, 'sample_rate': 1.024e6, 'samples_per_hash': 4096, 'gain': 0})
+
+        def on_success(p):
+            self._ui(self._on_sdr_ready, p)
+
+        def on_fail(msg):
+            self._ui(self._on_sdr_init_failed, msg)
 
+        def provider():
             # Use a persistent instance stored on self to avoid repeated init
             if getattr(self, '_sdr_instance', None) is None:
                 if SDRRNG is None:
                     raise RuntimeError('SDR libraries not available (install pyrtlsdr + numpy)')
-
-                # Try a sequence of initialization parameter sets to help older
-                # R820T dongles that sometimes fail to lock at higher sample
-                # rates or with aggressive buffer sizes. Record attempts in
-                # the log and try progressively more conservative settings.
-                tried = []
-                param_sets = []
-                # Merge any user-provided sdr_params into trial sets
-                base = dict(sdr_params or {})
-                # Try preferred/default first
-                param_sets.append({**base})
-                # Lower sample rate and buffer sizes
-                param_sets.append({**base, 'sample_rate': 2.048e6, 'samples_per_hash': 16384})
-                # Try explicit maximum gain
-                param_sets.append({**base, 'sample_rate': 2.048e6, 'samples_per_hash': 8192, 'gain': 49.6})
-                # Try minimal gain
-                param_sets.append({**base, 'sample_rate': 1.024e6, 'samples_per_hash': 4096, 'gain': 0})
-
-                last_exc = None
-                for p in param_sets:
-                    try:
-                        logger.debug('Attempting SDR init with params: %s', p)
-                        self._sdr_instance = SDRRNG(**p)
-                        # success
-                        logger.info('SDR initialized with params: %s', p)
-                        break
-                    except Exception as exc:
-                        logger.warning('SDR init failed with params %s: %s', p, exc)
-                        tried.append((p, str(exc)))
-                        last_exc = exc
-                        self._sdr_instance = None
-
-                if self._sdr_instance is None:
-                    # Provide a helpful error including attempts
-                    msg = 'SDR initialization failed after尝试: ' + '; '.join([f"{t[0]} -> {t[1]}" for t in tried])
-                    logger.error(msg)
-                    raise RuntimeError(msg) from last_exc
+                t = self._sdr_init_thread
+                if t is not None and t.is_alive():
+                    raise SDRNotReadyError('SDR initialization in progress')
+                p = param_sets[0]
+                try:
+                    logger.debug('Attempting SDR init with params: %s', p)
+                    self._sdr_instance = SDRRNG(**p)
+                    logger.info('SDR initialized with params: %s', p)
+                    on_success(p)
+                except Exception as exc:
+                    logger.warning('SDR init failed with params %s: %s', p, exc)
+                    self._sdr_instance = None
+                    self._try_init_sdr_async(SDRRNG, param_sets[1:], on_success, on_fail,
+                                             tried=[(p, str(exc))])
+                    raise SDRNotReadyError('SDR initialization in progress') from exc
 
             try:
                 raw = self._sdr_instance._collect_raw_bytes()
@@ -2839,7 +4137,12 @@ class ConsciousnessLab:
                     pass
                 # Attempt to compute measured peak frequency if supported
                 try:
-                    if getattr(self, '_sdr_spectral_enabled', True) and hasattr(self._sdr_instance, 'get_peak_frequency'):
+                    # The peak needs an FFT; the UI polls at 10 Hz and smooths it,
+                    # so refresh at most every 250 ms regardless of the read rate
+                    now = time.monotonic()
+                    if (getattr(self, '_sdr_spectral_enabled', True) and now >= self._sdr_peak_next_ts
+                            and hasattr(self._sdr_instance, 'get_peak_frequency')):
+                        self._sdr_peak_next_ts = now + 0.25
                         pf = self._sdr_instance.get_peak_frequency()
                         if pf is not None:
                             self._sdr_last_measured_freq = float(pf)
@@ -2861,6 +4164,116 @@ class ConsciousnessLab:
 
         return provider
 
+    def _try_init_sdr_async(self, sdr_cls, param_sets, on_success, on_fail, tried=()):
+        """Try `param_sets` in order on a background thread until `sdr_cls`
+        opens; the instance is stored on `self._sdr_instance`.
+
+        `on_success(params)` / `on_fail(message)` are called from that thread.
+        An instance opened after the stream was stopped is closed again.
+        """
+        tried = list(tried)
+        stop = self._sdr_producer_stop
+
+        def _sweep():
+            last_exc = None
+            for p in param_sets:
+                if stop is not None and stop.is_set():
+                    return
+                try:
+                    logger.debug('Attempting SDR init with params: %s', p)
+                    inst = sdr_cls(**p)
+                except Exception as exc:
+                    logger.warning('SDR init failed with params %s: %s', p, exc)
+                    tried.append((p, str(exc)))
+                    last_exc = exc
+                    continue
+                if stop is not None and stop.is_set():
+                    close_fn = getattr(inst, 'close', None)
+                    if callable(close_fn):
+                        close_fn()
+                    return
+                self._sdr_instance = inst
+                logger.info('SDR initialized with params: %s', p)
+                on_success(p)
+                return
+            # Provide a helpful error including attempts
+            msg = 'SDR initialization failed after attempts: ' + '; '.join([f"{t[0]} -> {t[1]}" for t in tried])
+            logger.error(msg, exc_info=last_exc)
+            on_fail(msg)
+
+        self._sdr_init_thread = threading.Thread(target=_sweep, daemon=True, name='mf-sdr-init')
+        self._sdr_init_thread.start()
+
+    def _on_sdr_ready(self, params):
+        """Main thread: the SDR device opened while streaming."""
+        if not getattr(self, '_sdr_streaming', False):
+            return
+        self._set_led(self.sdr_led, 'on')
+        try:
+            self.status_bar.config(text="SDR stream started")
+        except Exception:
+            pass
+
+    def _on_sdr_init_failed(self, msg):
+        """Main thread: every SDR parameter set failed; the producer keeps retrying."""
+        if not getattr(self, '_sdr_streaming', False):
+            return
+        self._set_led(self.sdr_led, 'off')
+        try:
+            self.status_bar.config(text="SDR initialization failed; retrying (see log)")
+        except Exception:
+            pass
+
+    def _sdr_producer_loop(self, reader, q, stop):
+        """Producer thread: read SDR blocks and queue them, dropping blocks when
+        the consumer falls behind."""
+        while not stop.is_set():
+            try:
+                raw = reader()
+            except SDRNotReadyError:
+                stop.wait(0.5)
+                continue
+            except Exception as exc:
+                logger.debug('SDR producer read failed: %s', exc)
+                stop.wait(0.5)
+                continue
+            try:
+                q.put(raw, timeout=1)
+            except Full:
+                pass
+
+    def _start_sdr_producer(self, reader):
+        """Start the SDR producer thread and return a provider for
+        `RNGCollector.start_sdr_stream` that drains its queue."""
+        q = Queue(maxsize=4)
+        stop = threading.Event()
+        self._sdr_producer_stop = stop
+        self._sdr_producer_thread = threading.Thread(
+            target=self._sdr_producer_loop, args=(reader, q, stop), daemon=True, name='mf-sdr')
+        self._sdr_producer_thread.start()
+
+        def provider():
+            try:
+                return q.get(timeout=0.5)
+            except Empty:
+                return b''
+
+        return provider
+
+    def _stop_sdr_producer(self):
+        """Signal the SDR producer thread to exit and wait briefly for it."""
+        stop = getattr(self, '_sdr_producer_stop', None)
+        if stop is not None:
+            stop.set()
+        t = getattr(self, '_sdr_producer_thread', None)
+        if t is not None:
+            try:
+                t.join(timeout=2)
+            except Exception:
+                pass
+        self._sdr_producer_stop = None
+        self._sdr_producer_thread = None
+
     def toggle_sdr_stream(self):
         """Start/stop continuous SDR streaming into the RNGCollector."""
         # Respect temporary disable/backoff window after repeated failures
@@ -2873,12 +4286,15 @@ class ConsciousnessLab:
         if not getattr(self, '_sdr_streaming', False):
             # Attempt to start; if provider init fails repeatedly, back off and disable SDR UI
             try:
-                provider = self._sdr_provider_factory(1024)
+                # Dongle reads and the spectral peak run on a producer thread;
+                # the collector only drains its bounded queue
+                provider = self._start_sdr_producer(self._sdr_provider_factory(1024))
                 self.rng_collector.start_sdr_stream(provider)
                 self._sdr_streaming = True
                 self.sdr_stream_btn.config(text="  Stop SDR Stream")
-                self.status_bar.config(text="SDR stream started")
-                self._set_led(self.sdr_led, 'on')
+                # the device opens on the producer thread; `_on_sdr_ready` turns the LED on
+                self.status_bar.config(text="SDR initializing…")
+                self._set_led(self.sdr_led, 'unknown')
                 # initialize bits counter snapshot for throughput calc
                 try:
                     self._sdr_last_bits_count = len(self.rng_collector.bits)
@@ -2901,10 +4317,7 @@ class ConsciousnessLab:
                     self._sdr_disabled_until = time.time() + getattr(self, '_sdr_fail_backoff_secs', 300)
                     try:
                         self.sdr_stream_btn.config(text="SDR Disabled (errors)")
-                        try:
-                            self.sdr_stream_btn.state(['disabled'])
-                        except Exception:
-                            self.sdr_stream_btn.config(state='disabled')
+                        self._sdr_stream_btn_enable(False)
                     except Exception:
                         pass
                     msg = (f"SDR failed to start {self._sdr_fail_count} times.\n"
@@ -2912,7 +4325,7 @@ class ConsciousnessLab:
                            "Would you like to run a quick diagnostics (rtl_test -t)?")
                     if messagebox.askyesno('SDR Error', msg):
                         # Run diagnostics in background thread
-                        threading.Thread(target=self._run_sdr_diagnostics, daemon=True).start()
+                        self._bg_pool.submit(self._run_sdr_diagnostics)
                 else:
                     messagebox.showwarning('SDR Stream', f'Could not start SDR streaming: {e}\n(Attempt {self._sdr_fail_count}/{getattr(self, "_sdr_fail_threshold")})')
         else:
@@ -2920,6 +4333,8 @@ class ConsciousnessLab:
                 self.rng_collector.stop_sdr_stream()
             except Exception:
                 pass
+            # Stop reading before the device is closed underneath the producer
+            self._stop_sdr_producer()
             try:
                 if getattr(self, '_sdr_instance', None) is not None:
                     close_fn = getattr(self._sdr_instance, 'close', None)
@@ -2935,39 +4350,91 @@ class ConsciousnessLab:
             self._set_led(self.sdr_led, 'off')
 
     def _run_sdr_diagnostics(self):
-        """Run `rtl_test -t` (best-effort) and show output in a dialog.
+        """Run `rtl_test -t` (best-effort) and stream its output into a dialog.
 
-        Runs in a background thread; uses `self.root.after` to display results.
+        Runs in a background thread; the dialog is opened straight away and
+        each output line is appended via `self._ui` as it arrives.
         """
-        out = ''
-        try:
-            # Try to run rtl_test; may not be present on all systems
-            proc = subprocess.run(['rtl_test', '-t'], capture_output=True, text=True, timeout=30)
-            out = (proc.stdout or '') + '\n' + (proc.stderr or '')
-        except FileNotFoundError:
-            out = 'rtl_test not found on this system. Install rtl-sdr package to run diagnostics.'
-        except subprocess.TimeoutExpired:
-            out = 'rtl_test timed out.'
-        except Exception as e:
-            out = f'Error running rtl_test: {e}'
+        ui = {}      # 'txt' is set on the main thread once the dialog exists
+        lines = []   # full output, for the messagebox fallback
 
-        def _show():
+        def _open():
             try:
                 dlg = tk.Toplevel(self.root)
                 dlg.title('SDR Diagnostics')
                 dlg.geometry('720x420')
                 txt = scrolledtext.ScrolledText(dlg, wrap=tk.WORD)
-                txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-                txt.insert(tk.END, out)
+                txt.insert('1.0', 'Running rtl_test -t...\n')
                 txt.configure(state=tk.DISABLED)
+                txt.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
                 tk.Button(dlg, text='Close', command=dlg.destroy).pack(pady=6)
+                ui['txt'] = txt
             except Exception:
-                messagebox.showinfo('SDR Diagnostics', out)
+                ui['txt'] = None
+
+        def _append(text):
+            txt = ui.get('txt')
+            if txt is None:
+                return
+            try:
+                txt.configure(state=tk.NORMAL)
+                txt.insert(tk.END, text)
+                txt.see(tk.END)
+                txt.configure(state=tk.DISABLED)
+            except tk.TclError:
+                # dialog closed by the user; keep draining the process
+                pass
+
+        def _post(text):
+            lines.append(text)
+            self._ui(_append, text)
+
+        def _done():
+            if ui.get('txt') is None:
+                self._ui_dialog('showinfo', 'SDR Diagnostics', ''.join(lines))
+
+        self._ui(_open)
 
         try:
-            self.root.after(0, _show)
-        except Exception:
-            pass
+            # Try to run rtl_test; may not be present on all systems
+            proc = subprocess.Popen(['rtl_test', '-t'], stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True, bufsize=1)
+        except FileNotFoundError:
+            _post('rtl_test not found on this system. Install rtl-sdr package to run diagnostics.\n')
+            proc = None
+        except Exception as e:
+            _post(f'Error running rtl_test: {e}\n')
+            proc = None
+
+        if proc is not None:
+            # Same 30 s limit as before; killing the process ends the read loop
+            timed_out = threading.Event()
+
+            def _kill():
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(30, _kill)
+            timer.daemon = True
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    _post(line)
+                proc.wait()
+            except Exception as e:
+                _post(f'Error reading rtl_test output: {e}\n')
+            finally:
+                timer.cancel()
+                try:
+                    proc.stdout.close()
+                except Exception:
+                    pass
+            if timed_out.is_set():
+                _post('\nrtl_test timed out.\n')
+            else:
+                _post(f'\n[rtl_test exited with code {proc.returncode}]\n')
+
+        self._ui(_done)
 
     def _on_spectral_toggle(self):
         """Callback when spectral analysis checkbox is toggled."""
@@ -2987,20 +4454,25 @@ class ConsciousnessLab:
             if path.endswith('.json'):
                 with open(path, 'r') as f:
                     obj = json.load(f)
-                # Accept several formats: raw_bits list, baseline_bits list, hex string
+                # Accept several formats: raw_bits list, packed raw_bits_b64 (session
+                # exports), baseline_bits list, hex string
                 if isinstance(obj, dict):
                     if 'baseline_bits' in obj and isinstance(obj['baseline_bits'], list):
                         bits = obj['baseline_bits']
                     elif 'raw_bits' in obj and isinstance(obj['raw_bits'], list):
                         bits = obj['raw_bits']
+                    elif 'raw_bits_b64' in obj and isinstance(obj['raw_bits_b64'], str):
+                        try:
+                            bits = _unpack_bits_le(base64.b64decode(obj['raw_bits_b64'], validate=True))
+                            count = obj.get('raw_bits_count')
+                            if isinstance(count, int):
+                                bits = bits[:count]
+                        except Exception:
+                            bits = None
                     elif 'seed' in obj and isinstance(obj['seed'], str):
                         # hex seed -> unpack
                         try:
-                            b = bytes.fromhex(obj['seed'])
-                            bits = []
-                            for byte in b:
-                                for i in range(8):
-                                    bits.append((byte >> i) & 1)
+                            bits = _unpack_bits_le(bytes.fromhex(obj['seed']))
                         except Exception:
                             bits = None
                 elif isinstance(obj, list) and all(isinstance(x, int) for x in obj):
@@ -3008,25 +4480,25 @@ class ConsciousnessLab:
             else:
                 # Try CSV, assume a column of 0/1 or hex
                 bits = []
-                with open(path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        # Accept lines with digits separated by commas
-                        parts = [p.strip() for p in line.split(',') if p.strip()]
-                        for p in parts:
-                            if p in ('0','1'):
-                                bits.append(int(p))
-                            else:
-                                # try parse hex
-                                try:
-                                    b = bytes.fromhex(p)
-                                    for byte in b:
-                                        for i in range(8):
-                                            bits.append((byte >> i) & 1)
-                                except Exception:
-                                    continue
+                # consecutive hex tokens are collected and unpacked in one call;
+                # flushed before any 0/1 token so bit order is preserved
+                pending = bytearray()
+                is_hex = _HEX_TOKEN_RE.fullmatch
+                with open(path, 'r', buffering=1 << 20, newline='') as f:
+                    # Accept rows of 0/1 and/or hex tokens separated by commas
+                    for row in csv.reader(f):
+                        for p in row:
+                            p = p.strip()
+                            if p == '0' or p == '1':
+                                if pending:
+                                    bits.extend(_unpack_bits_le(pending))
+                                    pending.clear()
+                                bits.append(1 if p == '1' else 0)
+                            elif p and is_hex(p):
+                                # pre-validated, so fromhex does not raise for junk tokens
+                                pending += bytes.fromhex(p)
+                if pending:
+                    bits.extend(_unpack_bits_le(pending))
 
             if bits is None:
                 messagebox.showwarning('Import Baseline', 'Could not parse baseline file')
@@ -3062,11 +4534,35 @@ class ConsciousnessLab:
         
     def on_closing(self):
         if self.running:
-            if messagebox.askokcancel("Quit", "Stop current session and exit?"):
-                self.stop_session()
-                self.root.destroy()
-        else:
-            self.root.destroy()
+            if not messagebox.askokcancel("Quit", "Stop current session and exit?"):
+                return
+            self.stop_session()
+        for pool in (self._bg_pool, self._serial_pool):
+            try:
+                if sys.version_info >= (3, 9):
+                    pool.shutdown(wait=False, cancel_futures=True)
+                else:
+                    # cancel_futures is 3.9+; queued jobs still run on 3.8
+                    pool.shutdown(wait=False)
+            except Exception:
+                pass
+        try:
+            if self._bt_glib_loop is not None:
+                self._bt_glib_loop.quit()
+        except Exception:
+            pass
+        try:
+            self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
+        except Exception:
+            pass
+        if self._sdr_producer_stop is not None:
+            self._sdr_producer_stop.set()
+        try:
+            # Sentinel wakes and stops the blocking HRV consumer
+            put_dropping_oldest(self.coherence_queue, None)
+        except Exception:
+            pass
+        self.root.destroy()
 
 if __name__ == "__main__":
     app = ConsciousnessLab()
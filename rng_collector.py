@@ -4,6 +4,7 @@ from collections import deque
 import threading
 import hmac
 import hashlib
+import json
 
 class RNGCollector:
     def __init__(self):
@@ -17,6 +18,9 @@ class RNGCollector:
         self._sdr_stream_thread = None
         self._sdr_streaming = False
         self.mode = "experiment"  # "experiment" or "baseline"
+        # Bumped whenever bits are added; lets the UI skip recomputing stats
+        self.bits_version = 0
+        self._seen_bits_version = 0
         self._lock = threading.Lock()
         self._drbg = None
         
@@ -44,6 +48,7 @@ class RNGCollector:
                 self.baseline_bits.append(bit)
             else:
                 self.bits.append(bit)
+            self.bits_version += 1
             time.sleep(0.01)
     
     def mark_event(self, event_type, coherence_data=None, meta=None):
@@ -66,7 +71,9 @@ class RNGCollector:
 
         hrv_sample is expected to be the dict produced by HRVDeviceManager._parse_hr_data,
         containing at least 'timestamp', 'device', 'heart_rate', 'rr_intervals', 'coherence'.
-        We augment it with the current bit_index for correlation analysis.
+        We augment it with the current bit_index for correlation analysis, and
+        with 'rr_intervals_json' (compact JSON of the RR list) so exports do not
+        have to re-encode it.
         """
         try:
             if not isinstance(hrv_sample, dict):
@@ -75,11 +82,44 @@ class RNGCollector:
             entry.setdefault('timestamp', time.time())
             # Attach the bit index at the time this sample was observed
             entry['bit_index'] = len(self.bits)
+            entry['rr_intervals_json'] = json.dumps(entry.get('rr_intervals'), separators=(',', ':'))
             self.hrv_snapshots.append(entry)
             return True
         except Exception:
             return False
     
+    def record_hrv_snapshot_batch(self, hrv_samples):
+        """Record several HRV samples at once; see `record_hrv_snapshot`.
+
+        All samples in the batch share the bit index observed at call time.
+        Returns the number of samples recorded.
+        """
+        try:
+            bit_index = len(self.bits)
+            now = time.time()
+            dumps = json.dumps
+            entries = []
+            for sample in hrv_samples:
+                if not isinstance(sample, dict):
+                    continue
+                entry = dict(sample)
+                entry.setdefault('timestamp', now)
+                entry['bit_index'] = bit_index
+                entry['rr_intervals_json'] = dumps(entry.get('rr_intervals'), separators=(',', ':'))
+                entries.append(entry)
+            self.hrv_snapshots.extend(entries)
+            return len(entries)
+        except Exception:
+            return 0
+    
+    def has_new_data(self):
+        """Return True if bits were added since the previous call."""
+        v = self.bits_version
+        if v == self._seen_bits_version:
+            return False
+        self._seen_bits_version = v
+        return True
+
     def get_stats(self, window=1000):
         if self.mode == "baseline":
             bits_to_analyze = self.baseline_bits
@@ -227,6 +267,7 @@ class RNGCollector:
                                     self.baseline_bits.append(bit)
                                 else:
                                     self.bits.append(bit)
+                            self.bits_version += 1
                         # small throttle to allow UI responsiveness
                         time.sleep(0.01)
                     except Exception:
@@ -258,6 +299,7 @@ class RNGCollector:
                 for byte in bits_iterable:
                     for i in range(8):
                         self.baseline_bits.append((byte >> i) & 1)
+                self.bits_version += 1
                 return True
 
             # Iterable of ints
@@ -267,6 +309,7 @@ class RNGCollector:
                 else:
                     # ignore invalid values
                     continue
+            self.bits_version += 1
             return True
         except Exception:
             return False
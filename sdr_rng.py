@@ -53,33 +53,33 @@ class SDRRNG:
         self.gain = gain
         # Number of complex samples to read per hash cycle (must be even-ish)
         self.samples_per_hash = int(samples_per_hash)
-            self._sdr = None
-            self._open_device()
-
-        def _open_device(self):
-            """Open the RTL-SDR device once and configure it for repeated reads."""
-            if self._sdr is not None:
-                return
-            self._sdr = RtlSdr()
-            self._sdr.sample_rate = float(self.sample_rate)
-            self._sdr.center_freq = float(self.center_freq)
-            self._sdr.gain = self.gain
-
-        def close(self):
-            """Release the underlying RTL-SDR device."""
-            if self._sdr is not None:
-                try:
-                    self._sdr.close()
-                except Exception:
-                    pass
-                finally:
-                    self._sdr = None
-
-        def __del__(self):
+        self._sdr = None
+        self._open_device()
+
+    def _open_device(self):
+        """Open the RTL-SDR device once and configure it for repeated reads."""
+        if self._sdr is not None:
+            return
+        self._sdr = RtlSdr()
+        self._sdr.sample_rate = float(self.sample_rate)
+        self._sdr.center_freq = float(self.center_freq)
+        self._sdr.gain = self.gain
+
+    def close(self):
+        """Release the underlying RTL-SDR device."""
+        if self._sdr is not None:
             try:
-                self.close()
+                self._sdr.close()
             except Exception:
                 pass
+            finally:
+                self._sdr = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def _collect_raw_bytes(self):
         """Read samples from the SDR and return raw bytes extracted from I/Q LSBs."""